@@ -10,6 +10,7 @@ import operator
 import os
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated, Any, Dict, List, Literal, Optional, TypedDict
 
@@ -488,8 +489,7 @@ def visual_qa_node(state: PipelineState) -> Dict[str, Any]:
         print("   [LangGraph] Visual QA node: weak typography score — allowing extra iteration")
 
     try:
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "visual_qa"))
-        from agent import VisualQAFeedbackAgent
+        from agents.visual_qa.agent import VisualQAFeedbackAgent
 
         visual_qa_feedback = VisualQAFeedbackAgent(content_source=content_source)
 
@@ -725,7 +725,12 @@ def compile_qa_pipeline(checkpointer=None):
     return graph.compile(checkpointer=checkpointer)
 
 
+@lru_cache(maxsize=1)
 def export_mermaid_diagram() -> str:
-    """Export the pipeline graph as a Mermaid diagram string."""
+    """Export the pipeline graph as a Mermaid diagram string.
+
+    The graph topology is fixed at import time, so the rendered diagram is
+    computed once and reused.
+    """
     graph = build_qa_graph()
     return graph.compile().get_graph().draw_mermaid()
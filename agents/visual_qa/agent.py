@@ -1,13 +1,19 @@
 """Dynamic Visual QA Agent that processes findings and applies improvements."""
 
 import os
+import re
 import shutil
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add project root to path (once) so the module also runs as a script
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from tools.change_tracker import ChangeTracker
 from tools.llm_latex_generator import LLMLaTeXGenerator
@@ -20,6 +26,16 @@ try:
 except ImportError:
     PatternInjector = None
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Severity keywords used to adjust issue priority
+HIGH_PRIORITY_WORDS = frozenset({"unreadable", "poor", "bad", "error"})
+MEDIUM_PRIORITY_WORDS = frozenset({"improve", "enhance", "better"})
+LOW_PRIORITY_WORDS = frozenset({"slightly", "minor", "small"})
+
 
 @dataclass
 class ImprovementAction:
@@ -52,6 +68,11 @@ class VisualQAFeedbackAgent:
                 print(f"⚠️  Could not load pattern injector: {e}")
 
         self.improvement_patterns = self._load_improvement_patterns()
+        self._keyword_re = self._compile_keyword_regex()
+        self._keyword_automaton = self._build_keyword_automaton()
+        self._classify_issue = lru_cache(maxsize=512)(self._classify_issue)
+        # Anchored at line start so a commented-out \begin{document} is skipped
+        self._begin_doc_re = re.compile(r'^[ \t]*\\begin\{document\}', re.MULTILINE)
 
     def _load_improvement_patterns(self) -> Dict[str, Dict]:
         """Load patterns for mapping Visual QA issues to LaTeX improvements."""
@@ -104,6 +125,47 @@ class VisualQAFeedbackAgent:
             }
         }
 
+    def _compile_keyword_regex(self) -> re.Pattern:
+        """Build a single regex matching every improvement-pattern keyword.
+
+        Each pattern category is a named group. The alternation sits inside a
+        lookahead so keywords from different categories that overlap in the
+        issue text are all reported.
+        """
+        alternation = "|".join(
+            f"(?P<{name}>{'|'.join(re.escape(keyword) for keyword in info['keywords'])})"
+            for name, info in self.improvement_patterns.items()
+        )
+        return re.compile(f"(?=(?:{alternation}))", re.IGNORECASE)
+
+    def _build_keyword_automaton(self):
+        """Build an Aho-Corasick automaton over all keywords, if pyahocorasick is installed.
+
+        Each keyword maps to (pattern_order, pattern_name) so the earliest
+        pattern category can be picked among all matches.
+        """
+        if ahocorasick is None:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for order, (name, info) in enumerate(self.improvement_patterns.items()):
+            for keyword in info["keywords"]:
+                keyword = keyword.lower()
+                # Keep the earliest category if a keyword appears in several
+                if keyword not in automaton:
+                    automaton.add_word(keyword, (order, name))
+        automaton.make_automaton()
+        return automaton
+
+    def _match_pattern_name(self, issue_lower: str) -> Optional[str]:
+        """Return the earliest pattern category with a keyword in the issue, or None."""
+        if self._keyword_automaton is not None:
+            matches = [value for _, value in self._keyword_automaton.iter(issue_lower)]
+            return min(matches)[1] if matches else None
+
+        matched = {match.lastgroup for match in self._keyword_re.finditer(issue_lower)}
+        return next((name for name in self.improvement_patterns if name in matched), None)
+
     def analyze_and_improve(self, pdf_path: str, max_iterations: int = 3) -> Tuple[str, List[str], Optional[str]]:
         """
         Analyze PDF with Visual QA and iteratively improve it.
@@ -115,6 +177,13 @@ class VisualQAFeedbackAgent:
         improvements_made = []
         final_version = None
 
+        # Paths and filenames that do not change between iterations
+        tex_path = str(Path(pdf_path).with_suffix('.tex'))
+        tex_filename = f"{self.content_source}.tex" if self.content_source else "research_report.tex"
+        pdf_filename = f"{self.content_source}.pdf" if self.content_source else "research_report.pdf"
+        iterations_dir = Path("artifacts/reviewed_content/v3_visual_qa/iterations")
+        iterations_dir.mkdir(parents=True, exist_ok=True)
+
         for iteration in range(max_iterations):
             print(f"\n🔄 Visual QA Iteration {iteration + 1}/{max_iterations}")
             print("=" * 50)
@@ -140,40 +209,40 @@ class VisualQAFeedbackAgent:
             for action in actions:
                 print(f"  - {action.description} (Priority: {action.priority})")
 
+            # Read the current LaTeX once; it feeds both the fixes and version tracking
+            with open(tex_path, 'r', encoding='utf-8') as f:
+                old_latex_content = f.read()
+
             # Apply improvements
-            tex_path = pdf_path.replace('.pdf', '.tex')
-            improved_tex = self._apply_improvements(tex_path, actions)
+            improved_tex, new_latex_content = self._apply_improvements(old_latex_content, actions, tex_path)
+
+            # Nothing to compile, version or diff if the fixes left the LaTeX as is
+            if new_latex_content == old_latex_content:
+                print("ℹ️ Improvements produced no LaTeX changes, stopping")
+                break
 
             # Track version before compilation
             version_name = f"v3_visual_qa_iter{iteration + 1}"
             parent_version = "v2_latex_optimized" if iteration == 0 else f"v3_visual_qa_iter{iteration}"
 
-            # Read old and new LaTeX content for version tracking
-            with open(tex_path, 'r', encoding='utf-8') as f:
-                old_latex_content = f.read()
-            with open(improved_tex, 'r', encoding='utf-8') as f:
-                new_latex_content = f.read()
-
             # Recompile PDF to iterations folder
-            iterations_dir = Path("artifacts/reviewed_content/v3_visual_qa/iterations")
-            iterations_dir.mkdir(parents=True, exist_ok=True)
             new_pdf_path = str(iterations_dir / f"iteration_{iteration + 1}.pdf")
 
+            improvement_descriptions = [action.description for action in actions]
+
             if self._compile_improved_tex(improved_tex, new_pdf_path):
                 # Save version to reviewed_content
                 version_dir = Path(f"artifacts/reviewed_content/{version_name}")
                 version_dir.mkdir(parents=True, exist_ok=True)
 
                 # Save improved .tex file to version directory
-                tex_filename = f"{self.content_source}.tex" if self.content_source else "research_report.tex"
-                pdf_filename = f"{self.content_source}.pdf" if self.content_source else "research_report.pdf"
                 version_tex_path = version_dir / tex_filename
                 with open(version_tex_path, 'w', encoding='utf-8') as f:
                     f.write(new_latex_content)
 
-                # Copy PDF to version directory
+                # Link (or copy) PDF into version directory
                 version_pdf_path = version_dir / pdf_filename
-                shutil.copy(new_pdf_path, version_pdf_path)
+                self._link_or_copy(new_pdf_path, version_pdf_path)
 
                 # Track version in version manager
                 content_dict = {tex_filename: new_latex_content}
@@ -184,7 +253,7 @@ class VisualQAFeedbackAgent:
                     parent_version=parent_version,
                     metadata={
                         "iteration": iteration + 1,
-                        "improvements": [action.description for action in actions],
+                        "improvements": improvement_descriptions,
                         "qa_score": qa_results.overall_score
                     }
                 )
@@ -204,7 +273,7 @@ class VisualQAFeedbackAgent:
 
                 # Update current PDF for next iteration
                 current_pdf = new_pdf_path
-                improvements_made.extend([action.description for action in actions])
+                improvements_made.extend(improvement_descriptions)
                 final_version = version_name  # Track the final version created
             else:
                 print("❌ Compilation failed, reverting changes")
@@ -212,20 +281,31 @@ class VisualQAFeedbackAgent:
 
         return current_pdf, improvements_made, final_version
 
+    @staticmethod
+    def _link_or_copy(src: str, dst: Path):
+        """Hardlink ``src`` to ``dst``, falling back to a copy across filesystems.
+
+        Iteration PDFs are replaced with a move rather than rewritten in place,
+        so the shared inode never changes underneath the version copy.
+        """
+        if dst.exists():
+            dst.unlink()
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy(src, dst)
+
     def _extract_improvement_actions(self, qa_results: DocumentVisualQA) -> List[ImprovementAction]:
         """Extract actionable improvements from Visual QA results."""
-        actions = []
-
         # Analyze all page issues
-        all_issues = []
-        for page_result in qa_results.page_results:
-            all_issues.extend(page_result.issues_found)
+        all_issues = chain.from_iterable(page_result.issues_found for page_result in qa_results.page_results)
 
         # Map issues to improvement actions using AI analysis
-        for issue in all_issues:
-            action = self._map_issue_to_action(issue, qa_results.overall_score)
-            if action:
-                actions.append(action)
+        current_score = qa_results.overall_score
+        actions = [
+            action for action in (self._map_issue_to_action(issue, current_score) for issue in all_issues)
+            if action
+        ]
 
         # Sort by priority
         actions.sort(key=lambda x: x.priority, reverse=True)
@@ -234,30 +314,39 @@ class VisualQAFeedbackAgent:
 
     def _map_issue_to_action(self, issue: str, current_score: float) -> Optional[ImprovementAction]:
         """Map a specific issue to an improvement action."""
-        issue_lower = issue.lower()
+        classification = self._classify_issue(issue.lower())
+        if classification is None:
+            return None
+        pattern_name, latex_fix, issue_priority = classification
 
         # Priority based on current score (lower score = higher priority fixes)
         base_priority = max(1, 10 - int(current_score / 10))
 
-        for pattern_name, pattern_info in self.improvement_patterns.items():
-            for keyword in pattern_info["keywords"]:
-                if keyword in issue_lower:
-                    # Select appropriate fix based on issue context
-                    latex_fix = self._select_best_fix(issue, pattern_info["latex_fixes"])
+        return ImprovementAction(
+            issue_type=pattern_name,
+            description=f"Fix {pattern_name}: {issue}",
+            latex_fix=latex_fix,
+            priority=base_priority + issue_priority
+        )
 
-                    return ImprovementAction(
-                        issue_type=pattern_name,
-                        description=f"Fix {pattern_name}: {issue}",
-                        latex_fix=latex_fix,
-                        priority=base_priority + self._calculate_issue_priority(issue)
-                    )
+    def _classify_issue(self, issue_lower: str) -> Optional[Tuple[str, str, int]]:
+        """Return (pattern_name, latex_fix, issue_priority) for an issue, or None.
 
-        return None
+        Memoized per agent in ``__init__``: the result depends only on the issue
+        text, and the same issues tend to recur across QA iterations.
+        """
+        # Earlier pattern categories take precedence when several match
+        pattern_name = self._match_pattern_name(issue_lower)
+        if pattern_name is None:
+            return None
 
-    def _select_best_fix(self, issue: str, available_fixes: List[str]) -> str:
-        """Select the most appropriate fix for the specific issue."""
-        issue_lower = issue.lower()
+        # Select appropriate fix based on issue context
+        latex_fix = self._select_best_fix(issue_lower, self.improvement_patterns[pattern_name]["latex_fixes"])
 
+        return pattern_name, latex_fix, self._calculate_issue_priority(issue_lower)
+
+    def _select_best_fix(self, issue_lower: str, available_fixes: List[str]) -> str:
+        """Select the most appropriate fix for the specific (lowercased) issue."""
         # Simple heuristics for fix selection
         if "reduce" in issue_lower or "decrease" in issue_lower:
             return available_fixes[0]  # Usually the "smaller" option
@@ -266,26 +355,29 @@ class VisualQAFeedbackAgent:
         else:
             return available_fixes[len(available_fixes) // 2]  # Middle option
 
-    def _calculate_issue_priority(self, issue: str) -> int:
-        """Calculate additional priority based on issue severity."""
-        issue_lower = issue.lower()
-
-        # High priority keywords
-        if any(word in issue_lower for word in ["unreadable", "poor", "bad", "error"]):
+    def _calculate_issue_priority(self, issue_lower: str) -> int:
+        """Calculate additional priority based on (lowercased) issue severity."""
+        if any(word in issue_lower for word in HIGH_PRIORITY_WORDS):
             return 3
-        elif any(word in issue_lower for word in ["improve", "enhance", "better"]):
+        elif any(word in issue_lower for word in MEDIUM_PRIORITY_WORDS):
             return 2
-        elif any(word in issue_lower for word in ["slightly", "minor", "small"]):
+        elif any(word in issue_lower for word in LOW_PRIORITY_WORDS):
             return 1
         else:
             return 2
 
-    def _apply_improvements(self, tex_path: str, actions: List[ImprovementAction]) -> str:
-        """Apply improvement actions to LaTeX document using LLM reasoning."""
-        # Read current LaTeX content
-        with open(tex_path, 'r') as f:
-            content = f.read()
+    def _apply_improvements(self, content: str, actions: List[ImprovementAction],
+                            tex_path: str) -> Tuple[str, str]:
+        """Apply improvement actions to LaTeX document using LLM reasoning.
 
+        Args:
+            content: Current LaTeX source (already read from ``tex_path``)
+            actions: Improvement actions to apply
+            tex_path: Path of the source .tex file, used to name the improved copy
+
+        Returns:
+            Tuple of (improved_tex_path, improved_latex_content)
+        """
         # Extract issue descriptions from actions
         issues = [action.description for action in actions]
 
@@ -302,39 +394,32 @@ class VisualQAFeedbackAgent:
         if not success:
             print("⚠️ LLM fixes failed, falling back to manual approach")
             # Fallback to simple approach
-            for action in actions:
-                fixed_latex = self._apply_latex_fix_simple(fixed_latex, action)
+            fixed_latex = self._apply_latex_fixes_batch(fixed_latex, actions)
 
         # Write improved version
-        improved_path = tex_path.replace('.tex', '_improved.tex')
+        source_path = Path(tex_path)
+        improved_path = str(source_path.with_name(f"{source_path.stem}_improved.tex"))
         with open(improved_path, 'w', encoding='utf-8') as f:
             f.write(fixed_latex)
 
-        return improved_path
+        return improved_path, fixed_latex
 
-    def _apply_latex_fix_simple(self, content: str, action: ImprovementAction) -> str:
-        """Apply a specific LaTeX fix to the content (simple fallback method)."""
-        # This is the old simple method, kept as fallback
-        # Insert fix in preamble before \begin{document}
-        begin_doc_pos = content.find('\\begin{document}')
-        if begin_doc_pos == -1:
+    def _apply_latex_fixes_batch(self, content: str, actions: List[ImprovementAction]) -> str:
+        """Apply LaTeX fixes for all actions in one splice (simple fallback method)."""
+        # Insert fixes in preamble before the first uncommented \begin{document}
+        begin_doc_match = self._begin_doc_re.search(content)
+        if begin_doc_match is None or not actions:
             return content
+        begin_doc_pos = begin_doc_match.start()
 
-        # Add improvement comment and fix
-        improvement_block = f"""
-% Visual QA Improvement: {action.description}
-{action.latex_fix}
-
-"""
-
-        # Insert before \begin{document}
-        improved_content = (
-            content[:begin_doc_pos] +
-            improvement_block +
-            content[begin_doc_pos:]
+        # Add an improvement comment and fix per action, in action order
+        improvement_block = "".join(
+            f"\n% Visual QA Improvement: {action.description}\n{action.latex_fix}\n\n"
+            for action in actions
         )
 
-        return improved_content
+        # Insert before \begin{document}
+        return content[:begin_doc_pos] + improvement_block + content[begin_doc_pos:]
 
     def _compile_improved_tex(self, tex_path: str, output_pdf: str, max_corrections: int = 3) -> bool:
         """
@@ -347,19 +432,14 @@ class VisualQAFeedbackAgent:
             # First compilation attempt
             success, message = self.pdf_compiler.compile(tex_path)
             if success:
-                # Move generated PDF to desired location
-                generated_pdf = tex_path.replace('.tex', '.pdf')
-                if os.path.exists(generated_pdf) and generated_pdf != output_pdf:
-                    # Remove existing file first (Windows compatibility)
-                    if os.path.exists(output_pdf):
-                        os.remove(output_pdf)
-                    shutil.move(generated_pdf, output_pdf)
+                self._move_generated_pdf(tex_path, output_pdf)
                 return True
 
             # Compilation failed - enter self-correction loop
             print("⚠️ Initial compilation failed. Starting LLM self-correction...")
 
-            # Read the failed LaTeX
+            # Read the failed LaTeX back from disk: the compiler's auto-fix
+            # pass may have rewritten it, and that change must not be lost
             with open(tex_path, 'r', encoding='utf-8') as f:
                 failed_latex = f.read()
 
@@ -373,21 +453,19 @@ class VisualQAFeedbackAgent:
                 print(f"❌ LLM self-correction failed after {max_corrections} attempts")
                 return False
 
-            # Write the corrected LaTeX
-            with open(tex_path, 'w', encoding='utf-8') as f:
+            # Write the corrected LaTeX via a temp file so a failed write never
+            # leaves a truncated .tex behind
+            tmp_path = f"{tex_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 f.write(corrected_latex)
+            os.replace(tmp_path, tex_path)
 
             # Try compiling the corrected version
             print("🔄 Compiling LLM-corrected LaTeX...")
             success, message = self.pdf_compiler.compile(tex_path)
 
             if success:
-                generated_pdf = tex_path.replace('.tex', '.pdf')
-                if os.path.exists(generated_pdf) and generated_pdf != output_pdf:
-                    # Remove existing file first (Windows compatibility)
-                    if os.path.exists(output_pdf):
-                        os.remove(output_pdf)
-                    shutil.move(generated_pdf, output_pdf)
+                self._move_generated_pdf(tex_path, output_pdf)
                 print("✅ LLM self-correction successful! PDF generated.")
                 return True
             else:
@@ -398,6 +476,16 @@ class VisualQAFeedbackAgent:
             print(f"❌ Compilation error: {e}")
             return False
 
+    @staticmethod
+    def _move_generated_pdf(tex_path: str, output_pdf: str):
+        """Move the PDF compiled next to ``tex_path`` to ``output_pdf``."""
+        generated_pdf = str(Path(tex_path).with_suffix('.pdf'))
+        if os.path.exists(generated_pdf) and generated_pdf != output_pdf:
+            # Remove existing file first (Windows compatibility)
+            if os.path.exists(output_pdf):
+                os.remove(output_pdf)
+            shutil.move(generated_pdf, output_pdf)
+
 
 def main():
     """Test the dynamic Visual QA feedback system."""
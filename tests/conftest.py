@@ -1,13 +1,16 @@
 """Shared test fixtures for the QA pipeline test suite."""
 
+import importlib
 import sys
 from pathlib import Path
 
 import pytest
 
-# Ensure project root is on sys.path so imports work without pip install
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# Ensure project root is on sys.path so imports work without pip install.
+# Test modules rely on this rather than adjusting sys.path themselves.
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from agents.qa_orchestrator.quality_gates import (  # noqa: E402
     QualityAssessment,
@@ -15,61 +18,85 @@ from agents.qa_orchestrator.quality_gates import (  # noqa: E402
     QualityThresholds,
 )
 
+# Read-only assessments built once at import time and shared across the
+# session. The overall-gate assessments keep function scope below because
+# evaluate_overall_quality_gate writes ``overall_score`` into them.
+_PASSING_CONTENT_ASSESSMENT = QualityAssessment(
+    content_score=85,
+    content_issues=["minor style issue"],
+)
+_FAILING_CONTENT_ASSESSMENT = QualityAssessment(
+    content_score=60,
+    content_issues=["grammar", "readability", "structure"],
+)
+_PASSING_LATEX_ASSESSMENT = QualityAssessment(
+    latex_score=90,
+    latex_structure=23,
+    latex_typography=22,
+    latex_tables_figures=22,
+    latex_best_practices=23,
+    latex_issues=[],
+)
+_FAILING_LATEX_ASSESSMENT = QualityAssessment(
+    latex_score=70,
+    latex_structure=18,
+    latex_typography=15,
+    latex_tables_figures=18,
+    latex_best_practices=19,
+    latex_issues=["bad spacing", "wrong font", "missing packages", "broken table"],
+)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def wf():
+    """The LangGraph workflow module, imported only by tests that need it.
+
+    Keeps LangGraph out of runs that select only the lightweight tests
+    (e.g. ``-k merge`` or the quality gate suite) and skips when it is not
+    installed.
+    """
+    pytest.importorskip("langgraph")
+    return importlib.import_module("agents.qa_orchestrator.langgraph_workflow")
+
+
+@pytest.fixture(scope="session")
 def default_thresholds():
     """Return default QualityThresholds."""
     return QualityThresholds()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gate_manager(default_thresholds):
-    """Return a QualityGateManager with default thresholds."""
+    """Return a QualityGateManager with default thresholds.
+
+    The evaluate_* methods only read the thresholds, so one manager is shared;
+    tests that call log_evaluation should build their own.
+    """
     return QualityGateManager(thresholds=default_thresholds)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def passing_content_assessment():
     """QualityAssessment with a content score that passes the gate."""
-    return QualityAssessment(
-        content_score=85,
-        content_issues=["minor style issue"],
-    )
+    return _PASSING_CONTENT_ASSESSMENT
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def failing_content_assessment():
     """QualityAssessment with a content score below minimum."""
-    return QualityAssessment(
-        content_score=60,
-        content_issues=["grammar", "readability", "structure"],
-    )
+    return _FAILING_CONTENT_ASSESSMENT
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def passing_latex_assessment():
     """QualityAssessment with a LaTeX score that passes the gate."""
-    return QualityAssessment(
-        latex_score=90,
-        latex_structure=23,
-        latex_typography=22,
-        latex_tables_figures=22,
-        latex_best_practices=23,
-        latex_issues=[],
-    )
+    return _PASSING_LATEX_ASSESSMENT
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def failing_latex_assessment():
     """QualityAssessment with a LaTeX score below minimum."""
-    return QualityAssessment(
-        latex_score=70,
-        latex_structure=18,
-        latex_typography=15,
-        latex_tables_figures=18,
-        latex_best_practices=19,
-        latex_issues=["bad spacing", "wrong font", "missing packages", "broken table"],
-    )
+    return _FAILING_LATEX_ASSESSMENT
 
 
 @pytest.fixture
@@ -0,0 +1,191 @@
+"""Tests for the change tracker's line diffing.
+
+All tests run without Docker, TeX Live, or API keys.
+"""
+
+import difflib
+import random
+
+import pytest
+
+from tools import change_tracker
+from tools.change_tracker import (
+    ChangeTracker,
+    _diff_opcodes,
+    _myers_opcodes,
+    _unified_diff_lines,
+)
+
+
+def _random_pair(rng, max_len=30, alphabet="abcde"):
+    """Two random line lists over a small alphabet, so they share many lines."""
+    a = [rng.choice(alphabet) + "\n" for _ in range(rng.randint(0, max_len))]
+    b = [rng.choice(alphabet) + "\n" for _ in range(rng.randint(0, max_len))]
+    return a, b
+
+
+def _apply_opcodes(a, b, opcodes):
+    """Rebuild ``b`` from ``a``, taking only inserted text from ``b``."""
+    out = []
+    i = j = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        assert (i1, j1) == (i, j), "opcodes must be contiguous"
+        if tag == "equal":
+            assert a[i1:i2] == b[j1:j2]
+            out.extend(a[i1:i2])
+        else:
+            out.extend(b[j1:j2])
+        i, j = i2, j2
+    assert (i, j) == (len(a), len(b))
+    return out
+
+
+def _edit_count(opcodes):
+    """Lines deleted plus lines inserted by an edit script."""
+    return sum((i2 - i1) + (j2 - j1) for tag, i1, i2, j1, j2 in opcodes if tag != "equal")
+
+
+def _lcs_length(a, b):
+    """Longest common subsequence length by dynamic programming."""
+    row = [0] * (len(b) + 1)
+    for x in a:
+        prev = 0
+        for j, y in enumerate(b, 1):
+            prev, row[j] = row[j], prev + 1 if x == y else max(row[j], row[j - 1])
+    return row[-1]
+
+
+def _large_pair(edits, lines=2500, seed=0):
+    """A file above the Myers threshold and a copy with ``edits`` scattered line changes."""
+    rng = random.Random(seed)
+    old = [f"line {i}\n" for i in range(lines)]
+    new = list(old)
+    for i in rng.sample(range(lines), edits):
+        new[i] = f"changed {i}\n"
+    return "".join(old), "".join(new)
+
+
+class TestMyersOpcodes:
+    def test_rebuilds_b_from_a(self):
+        """Opcodes turn ``a`` into ``b`` on random inputs."""
+        rng = random.Random(1)
+        for _ in range(500):
+            a, b = _random_pair(rng)
+            opcodes = _myers_opcodes(a, b, max_d=len(a) + len(b))
+            assert _apply_opcodes(a, b, opcodes) == b
+
+    def test_edit_count_is_minimal(self):
+        """The edit script is as short as the LCS allows, and never longer than difflib's."""
+        rng = random.Random(2)
+        for _ in range(300):
+            a, b = _random_pair(rng, max_len=15, alphabet="abc")
+            opcodes = _myers_opcodes(a, b, max_d=len(a) + len(b))
+            edits = _edit_count(opcodes)
+            assert edits == len(a) + len(b) - 2 * _lcs_length(a, b)
+            assert edits <= _edit_count(difflib.SequenceMatcher(None, a, b).get_opcodes())
+
+    @pytest.mark.parametrize("a, b", [
+        ([], []),
+        (["x\n"], ["x\n"]),
+        ([], ["x\n", "y\n"]),
+        (["x\n", "y\n"], []),
+        (["x\n"], ["y\n"]),
+    ])
+    def test_edge_cases(self, a, b):
+        """Empty, identical and fully replaced inputs."""
+        opcodes = _myers_opcodes(a, b)
+        assert _apply_opcodes(a, b, opcodes) == b
+
+    def test_gives_up_past_max_edit_distance(self):
+        """Returns None when the edit distance exceeds ``max_d``."""
+        a = [f"{i}\n" for i in range(10)]
+        b = [f"{i}!\n" for i in range(10)]
+        assert _myers_opcodes(a, b, max_d=5) is None
+        assert _myers_opcodes(a, b, max_d=20) is not None
+
+
+class TestUnifiedDiffLines:
+    def test_matches_difflib(self):
+        """Formatting the same opcodes reproduces difflib.unified_diff exactly."""
+        rng = random.Random(3)
+        for _ in range(300):
+            a, b = _random_pair(rng, max_len=40)
+            opcodes = difflib.SequenceMatcher(None, a, b).get_opcodes()
+            expected = list(difflib.unified_diff(a, b, "old", "new", lineterm=""))
+            assert list(_unified_diff_lines(a, b, opcodes, "old", "new")) == expected
+
+    def test_identical_inputs_produce_no_diff(self):
+        lines = ["same\n"] * 5
+        opcodes = _diff_opcodes(lines, lines)
+        assert list(_unified_diff_lines(lines, lines, opcodes, "old", "new")) == []
+
+
+class TestGenerateDiff:
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        return ChangeTracker(base_dir=str(tmp_path))
+
+    @pytest.fixture
+    def myers_results(self, monkeypatch):
+        """Record what every _myers_opcodes call returned."""
+        results = []
+        original = change_tracker._myers_opcodes
+
+        def spy(a, b, *args, **kwargs):
+            opcodes = original(a, b, *args, **kwargs)
+            results.append(opcodes)
+            return opcodes
+
+        monkeypatch.setattr(change_tracker, "_myers_opcodes", spy)
+        return results
+
+    def test_unchanged_content_returns_early(self, tracker, tmp_path):
+        """Equal inputs skip diffing and still write an empty diff file."""
+        diff_path = tmp_path / "same.diff"
+        result = tracker.generate_diff("a\nb\n", "a\nb\n", diff_path=diff_path)
+        assert result["sample_diff_lines"] == []
+        assert result["diff_line_count"] == 0
+        assert result["similarity_ratio"] == 1.0
+        assert result["statistics"]["total_changes"] == 0
+        assert result["old_line_count"] == result["new_line_count"] == 2
+        assert diff_path.read_text(encoding="utf-8") == ""
+
+    def test_sample_and_count_keys(self, tracker, tmp_path):
+        """Only a short sample is kept in memory; the count covers the whole diff."""
+        old = "".join(f"line {i}\n" for i in range(100))
+        new = "".join(f"line {i}{'!' if i % 10 == 0 else ''}\n" for i in range(100))
+        diff_path = tmp_path / "content.diff"
+        result = tracker.generate_diff(old, new, diff_path=diff_path)
+
+        expected = list(difflib.unified_diff(
+            old.splitlines(keepends=True), new.splitlines(keepends=True),
+            "content (old)", "content (new)", lineterm=""))
+        assert result["diff_line_count"] == len(expected)
+        assert result["sample_diff_lines"] == [
+            line for line in expected[:change_tracker._SAMPLE_DIFF_LINES] if line[:1] in "+-@"
+        ]
+        assert "diff_lines" not in result
+        assert result["statistics"]["modifications"] == 10
+        assert result["statistics"]["total_changes"] == 20
+        assert diff_path.read_text(encoding="utf-8") == "".join(expected)
+
+    def test_large_file_uses_myers(self, tracker, myers_results):
+        """Files over the line threshold are aligned by Myers' algorithm."""
+        old, new = _large_pair(edits=20)
+        result = tracker.generate_diff(old, new)
+        assert len(myers_results) == 1 and myers_results[0] is not None
+        assert result["statistics"]["modifications"] == 20
+        assert result["old_line_count"] == result["new_line_count"] == 2500
+
+    def test_large_rewrite_falls_back_to_difflib(self, tracker, myers_results):
+        """Past the edit distance limit the diff still comes out, via SequenceMatcher."""
+        edits = change_tracker._MYERS_MAX_EDIT_DISTANCE
+        old, new = _large_pair(edits=edits)
+        result = tracker.generate_diff(old, new)
+        assert myers_results == [None]
+        assert result["statistics"]["modifications"] == edits
+        assert result["statistics"]["total_changes"] == 2 * edits
+
+    def test_small_file_skips_myers(self, tracker, myers_results):
+        tracker.generate_diff("a\nb\n", "a\nc\n")
+        assert myers_results == []
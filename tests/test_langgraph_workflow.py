@@ -3,377 +3,331 @@
 All tests run without Docker, TeX Live, or API keys.
 """
 
-import sys
-from pathlib import Path
+import copy
+from contextlib import ExitStack
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-# Ensure project root is importable
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from agents.qa_orchestrator.langgraph_workflow import (  # noqa: E402, I001
-    build_qa_graph,
-    compile_qa_pipeline,
-    export_mermaid_diagram,
-    merge_dicts,
-    route_after_content_review,
-    route_after_latex_optimization,
-    route_after_quality_assessment,
-)
-from agents.qa_orchestrator.quality_gates import (  # noqa: E402
+import pytest
+
+from agents.qa_orchestrator.pipeline_types import AgentResult, AgentType
+from agents.qa_orchestrator.quality_gates import (
     QualityAssessment,
     QualityGateEvaluation,
     QualityGateManager,
     QualityGateResult,
 )
-from agents.qa_orchestrator.pipeline_types import AgentResult, AgentType  # noqa: E402
-
 
 # ---------------------------------------------------------------------------
 # Graph compilation tests
 # ---------------------------------------------------------------------------
 
+_PIPELINE_NODES = (
+    "content_review",
+    "latex_optimization",
+    "visual_qa",
+    "quality_assessment",
+    "iteration",
+    "completion",
+    "escalation",
+)
+
+
+@pytest.fixture(scope="session")
+def qa_graph(wf):
+    """Uncompiled QA StateGraph, built once per session."""
+    return wf.build_qa_graph()
+
+
+@pytest.fixture(scope="session")
+def compiled_pipeline(wf):
+    """Compiled QA pipeline, built once per session."""
+    return wf.compile_qa_pipeline()
+
+
+@pytest.fixture(scope="session")
+def mermaid_diagram(wf):
+    """Mermaid export of the QA pipeline, rendered once per session."""
+    return wf.export_mermaid_diagram()
+
+
 class TestGraphCompilation:
-    def test_graph_compiles(self):
+    def test_graph_compiles(self, compiled_pipeline):
         """Verify graph builds and compiles without error."""
-        app = compile_qa_pipeline()
-        assert app is not None
+        assert compiled_pipeline is not None
 
-    def test_build_qa_graph_returns_state_graph(self):
+    def test_build_qa_graph_returns_state_graph(self, qa_graph):
         """build_qa_graph returns an uncompiled StateGraph."""
-        graph = build_qa_graph()
-        assert graph is not None
+        assert qa_graph is not None
 
-    def test_mermaid_export(self):
+    def test_mermaid_export(self, mermaid_diagram):
         """Verify Mermaid diagram contains all node names."""
-        mermaid = export_mermaid_diagram()
-        assert isinstance(mermaid, str)
-        for node in [
-            "content_review",
-            "latex_optimization",
-            "visual_qa",
-            "quality_assessment",
-            "iteration",
-            "completion",
-            "escalation",
-        ]:
-            assert node in mermaid, f"Node '{node}' missing from Mermaid diagram"
+        assert isinstance(mermaid_diagram, str)
+        missing = [node for node in _PIPELINE_NODES if node not in mermaid_diagram]
+        assert not missing, f"Nodes {missing} missing from Mermaid diagram"
 
 
 # ---------------------------------------------------------------------------
 # Routing tests
 # ---------------------------------------------------------------------------
 
-class TestRouting:
-    @patch("agents.qa_orchestrator.langgraph_workflow.WorkflowCoordinator")
-    def test_route_content_pass(self, MockCoordinator):
-        """Score 85 routes to latex_optimization."""
-        mock_coord = MagicMock()
-        mock_coord.assess_workflow_quality.return_value = QualityAssessment(content_score=85, content_issues=[])
-        mock_coord.quality_gate_manager.evaluate_content_quality_gate.return_value = QualityGateEvaluation(
-            gate_name="content_quality",
-            result=QualityGateResult.PASS,
-            score=85,
-            threshold=80,
-            reasons=["Good content quality: 85"],
-            recommendations=[],
-            next_action="proceed_to_latex",
+def _coord(assessment=None, max_iterations=3, **gate_evaluations):
+    """Lightweight WorkflowCoordinator stand-in exposing only what the routers call.
+
+    Each keyword in ``gate_evaluations`` names a quality gate method (e.g.
+    ``evaluate_latex_quality_gate``) and the evaluation it returns; calling
+    any other gate raises AttributeError.
+    """
+    def assess_workflow_quality(*_):
+        return assessment
+
+    def gate(evaluation):
+        return lambda *_: evaluation
+
+    return SimpleNamespace(
+        assess_workflow_quality=assess_workflow_quality,
+        quality_gate_manager=SimpleNamespace(
+            thresholds=SimpleNamespace(max_iterations=max_iterations),
+            **{name: gate(evaluation) for name, evaluation in gate_evaluations.items()},
+        ),
+    )
+
+
+@pytest.fixture(autouse=True)
+def patch_coordinator(request, monkeypatch):
+    """Make WorkflowCoordinator(...) return the stub given by a ``coord`` marker.
+
+    Tests declare ``@pytest.mark.coord(_coord(...))``; unmarked tests are left
+    untouched.
+    """
+    marker = request.node.get_closest_marker("coord")
+    if marker is not None:
+        coord = marker.args[0]
+        monkeypatch.setattr(
+            "agents.qa_orchestrator.langgraph_workflow.WorkflowCoordinator",
+            lambda **_: coord,
         )
-        MockCoordinator.return_value = mock_coord
-
-        state = {
-            "content_source": "research_report",
-            "agent_results": [{"agent_type": "content_editor", "success": True, "version_created": "v1", "quality_score": 85, "processing_time": 1.0, "issues_found": [], "optimizations_applied": []}],
-            "quality_assessments": [],
-            "quality_evaluations": [],
-            "iterations_completed": 0,
-            "agent_context": {},
-        }
-        result = route_after_content_review(state)
-        assert result == "latex_optimization"
-
-    @patch("agents.qa_orchestrator.langgraph_workflow.WorkflowCoordinator")
-    def test_route_content_iterate(self, MockCoordinator):
-        """Score 60 routes to iteration."""
-        mock_coord = MagicMock()
-        mock_coord.assess_workflow_quality.return_value = QualityAssessment(content_score=60, content_issues=[])
-        mock_coord.quality_gate_manager.evaluate_content_quality_gate.return_value = QualityGateEvaluation(
-            gate_name="content_quality",
-            result=QualityGateResult.ITERATE,
-            score=60,
-            threshold=80,
-            reasons=["Content score 60 below minimum 80"],
-            recommendations=[],
-            next_action="run_content_editor",
-        )
-        mock_coord.quality_gate_manager.thresholds.max_iterations = 3
-        MockCoordinator.return_value = mock_coord
-
-        state = {
-            "content_source": "research_report",
-            "agent_results": [],
-            "quality_assessments": [],
-            "quality_evaluations": [],
-            "iterations_completed": 0,
-            "agent_context": {},
-        }
-        result = route_after_content_review(state)
-        assert result == "iteration"
 
-    @patch("agents.qa_orchestrator.langgraph_workflow.WorkflowCoordinator")
-    def test_route_content_escalate_at_max_iterations(self, MockCoordinator):
-        """Iterate result at max iterations routes to escalation."""
-        mock_coord = MagicMock()
-        mock_coord.assess_workflow_quality.return_value = QualityAssessment(content_score=60)
-        mock_coord.quality_gate_manager.evaluate_content_quality_gate.return_value = QualityGateEvaluation(
-            gate_name="content_quality",
-            result=QualityGateResult.ITERATE,
-            score=60,
-            threshold=80,
-            reasons=[],
-            recommendations=[],
-            next_action="run_content_editor",
-        )
-        mock_coord.quality_gate_manager.thresholds.max_iterations = 3
-        MockCoordinator.return_value = mock_coord
-
-        state = {
-            "content_source": "research_report",
-            "agent_results": [],
-            "quality_assessments": [],
-            "quality_evaluations": [],
-            "iterations_completed": 3,
-            "agent_context": {},
-        }
-        result = route_after_content_review(state)
-        assert result == "escalation"
-
-    @patch("agents.qa_orchestrator.langgraph_workflow.WorkflowCoordinator")
-    def test_route_latex_pass(self, MockCoordinator):
-        """Score 90 routes to visual_qa."""
-        mock_coord = MagicMock()
-        mock_coord.assess_workflow_quality.return_value = QualityAssessment(latex_score=90, latex_issues=[])
-        mock_coord.quality_gate_manager.evaluate_latex_quality_gate.return_value = QualityGateEvaluation(
-            gate_name="latex_quality",
-            result=QualityGateResult.PASS,
-            score=90,
-            threshold=85,
-            reasons=["Good LaTeX quality: 90"],
-            recommendations=[],
-            next_action="proceed_to_visual_qa",
-        )
-        MockCoordinator.return_value = mock_coord
-
-        state = {
-            "content_source": "research_report",
-            "agent_results": [],
-            "quality_assessments": [],
-            "quality_evaluations": [],
-            "iterations_completed": 0,
-            "agent_context": {},
-        }
-        result = route_after_latex_optimization(state)
-        assert result == "visual_qa"
-
-    @patch("agents.qa_orchestrator.langgraph_workflow.WorkflowCoordinator")
-    def test_route_latex_iterate(self, MockCoordinator):
-        """Low LaTeX score routes to iteration."""
-        mock_coord = MagicMock()
-        mock_coord.assess_workflow_quality.return_value = QualityAssessment(latex_score=70)
-        mock_coord.quality_gate_manager.evaluate_latex_quality_gate.return_value = QualityGateEvaluation(
-            gate_name="latex_quality",
-            result=QualityGateResult.ITERATE,
-            score=70,
-            threshold=85,
-            reasons=[],
-            recommendations=[],
-            next_action="run_latex_specialist",
-        )
-        mock_coord.quality_gate_manager.thresholds.max_iterations = 3
-        MockCoordinator.return_value = mock_coord
-
-        state = {
-            "content_source": "research_report",
-            "agent_results": [],
-            "quality_assessments": [],
-            "quality_evaluations": [],
-            "iterations_completed": 0,
-            "agent_context": {},
-        }
-        result = route_after_latex_optimization(state)
-        assert result == "iteration"
 
-    def test_route_overall_completion(self):
-        """Score 85 routes to completion."""
-        state = {
-            "quality_evaluations": [{
-                "gate_name": "overall_quality",
-                "result": "pass",
-                "score": 85,
-                "threshold": 80,
-                "reasons": ["Good overall quality: 85"],
-                "recommendations": [],
-                "next_action": "human_handoff",
-            }],
-            "iterations_completed": 0,
-        }
-        result = route_after_quality_assessment(state)
-        assert result == "completion"
-
-    def test_route_overall_iterate(self):
-        """Low overall score routes to iteration."""
-        state = {
-            "quality_evaluations": [{
-                "gate_name": "overall_quality",
-                "result": "iterate",
-                "score": 65,
-                "threshold": 80,
-                "reasons": [],
-                "recommendations": [],
-                "next_action": "iterate_pipeline",
-            }],
-            "iterations_completed": 1,
-        }
-        result = route_after_quality_assessment(state)
-        assert result == "iteration"
+# Minimal routing state for the coordinator-backed gate routers. Routers only
+# read the state, so tests build theirs with ``{**_BASE_ROUTING_STATE, ...}``
+# and share the empty containers; the proxy keeps the template itself frozen.
+_BASE_ROUTING_STATE = MappingProxyType({
+    "content_source": "research_report",
+    "agent_results": [],
+    "quality_assessments": [],
+    "quality_evaluations": [],
+    "iterations_completed": 0,
+    "agent_context": {},
+})
+
+
+# Gate evaluations are never mutated by the routers, so one instance of each
+# is shared by every parametrized case that needs it.
+_PASS_CONTENT = QualityGateEvaluation(
+    gate_name="content_quality",
+    result=QualityGateResult.PASS,
+    score=85,
+    threshold=80,
+    reasons=["Good content quality: 85"],
+    recommendations=[],
+    next_action="proceed_to_latex",
+)
+_ITERATE_CONTENT = QualityGateEvaluation(
+    gate_name="content_quality",
+    result=QualityGateResult.ITERATE,
+    score=60,
+    threshold=80,
+    reasons=["Content score 60 below minimum 80"],
+    recommendations=[],
+    next_action="run_content_editor",
+)
+_PASS_LATEX = QualityGateEvaluation(
+    gate_name="latex_quality",
+    result=QualityGateResult.PASS,
+    score=90,
+    threshold=85,
+    reasons=["Good LaTeX quality: 90"],
+    recommendations=[],
+    next_action="proceed_to_visual_qa",
+)
+_ITERATE_LATEX = QualityGateEvaluation(
+    gate_name="latex_quality",
+    result=QualityGateResult.ITERATE,
+    score=70,
+    threshold=85,
+    reasons=[],
+    recommendations=[],
+    next_action="run_latex_specialist",
+)
 
-    def test_route_overall_escalation(self):
-        """Iterations >= 3 with iterate result routes to escalation."""
-        state = {
-            "quality_evaluations": [{
-                "gate_name": "overall_quality",
-                "result": "iterate",
-                "score": 65,
-                "threshold": 80,
-                "reasons": [],
-                "recommendations": [],
-                "next_action": "iterate_pipeline",
-            }],
-            "iterations_completed": 3,
-        }
-        result = route_after_quality_assessment(state)
-        assert result == "escalation"
-
-    def test_route_overall_escalate_result(self):
-        """Explicit escalate result routes to escalation."""
-        state = {
-            "quality_evaluations": [{
-                "gate_name": "overall_quality",
-                "result": "escalate",
-                "score": 70,
-                "threshold": 80,
-                "reasons": [],
-                "recommendations": [],
-                "next_action": "human_escalation",
-            }],
-            "iterations_completed": 0,
-        }
-        result = route_after_quality_assessment(state)
-        assert result == "escalation"
 
-    def test_route_overall_no_evaluations(self):
-        """No evaluations routes to escalation."""
-        state = {"quality_evaluations": [], "iterations_completed": 0}
-        result = route_after_quality_assessment(state)
-        assert result == "escalation"
+def _overall_evaluation(result, score):
+    return {
+        "gate_name": "overall_quality",
+        "result": result,
+        "score": score,
+        "threshold": 80,
+        "reasons": [],
+        "recommendations": [],
+        "next_action": "iterate_pipeline",
+    }
+
+
+_OVERALL_PASS = _overall_evaluation("pass", 85)
+_OVERALL_ITERATE = _overall_evaluation("iterate", 65)
+_OVERALL_ESCALATE = _overall_evaluation("escalate", 70)
+
+
+# Stubs are read-only, so cases that differ only in iteration count share one.
+_CONTENT_ITERATE_COORD = _coord(
+    QualityAssessment(content_score=60, content_issues=[]),
+    evaluate_content_quality_gate=_ITERATE_CONTENT,
+)
+
+
+class TestRouting:
+    @pytest.mark.parametrize(
+        "router, iterations, expected",
+        [
+            pytest.param(
+                "route_after_content_review", 0, "latex_optimization", id="content_pass",
+                marks=pytest.mark.coord(_coord(
+                    QualityAssessment(content_score=85, content_issues=[]),
+                    evaluate_content_quality_gate=_PASS_CONTENT,
+                )),
+            ),
+            pytest.param(
+                "route_after_content_review", 0, "iteration", id="content_iterate",
+                marks=pytest.mark.coord(_CONTENT_ITERATE_COORD),
+            ),
+            pytest.param(
+                "route_after_content_review", 3, "escalation", id="content_escalate_at_max_iterations",
+                marks=pytest.mark.coord(_CONTENT_ITERATE_COORD),
+            ),
+            pytest.param(
+                "route_after_latex_optimization", 0, "visual_qa", id="latex_pass",
+                marks=pytest.mark.coord(_coord(
+                    QualityAssessment(latex_score=90, latex_issues=[]),
+                    evaluate_latex_quality_gate=_PASS_LATEX,
+                )),
+            ),
+            pytest.param(
+                "route_after_latex_optimization", 0, "iteration", id="latex_iterate",
+                marks=pytest.mark.coord(_coord(
+                    QualityAssessment(latex_score=70),
+                    evaluate_latex_quality_gate=_ITERATE_LATEX,
+                )),
+            ),
+        ],
+    )
+    def test_route_gate(self, wf, router, iterations, expected):
+        """Content and LaTeX gate results map to the expected next node."""
+        state = {**_BASE_ROUTING_STATE, "iterations_completed": iterations}
+        assert getattr(wf, router)(state) == expected
+
+    @pytest.mark.parametrize(
+        "evaluations, iterations, expected",
+        [
+            pytest.param([_OVERALL_PASS], 0, "completion", id="completion"),
+            pytest.param([_OVERALL_ITERATE], 1, "iteration", id="iterate"),
+            pytest.param([_OVERALL_ITERATE], 3, "escalation", id="escalation_at_max_iterations"),
+            pytest.param([_OVERALL_ESCALATE], 0, "escalation", id="escalate_result"),
+            pytest.param([], 0, "escalation", id="no_evaluations"),
+        ],
+    )
+    def test_route_overall(self, wf, evaluations, iterations, expected):
+        """Overall gate result and iteration count map to the expected outcome."""
+        state = {"quality_evaluations": evaluations, "iterations_completed": iterations}
+        assert wf.route_after_quality_assessment(state) == expected
 
 
 # ---------------------------------------------------------------------------
 # Inter-agent context tests
 # ---------------------------------------------------------------------------
 
-class TestInterAgentContext:
-    @patch("agents.qa_orchestrator.langgraph_workflow.WorkflowCoordinator")
-    def test_latex_node_reads_content_context_complex_tables(self, MockCoordinator):
-        """LaTeX node uses conservative optimization when complex tables flagged."""
-        from agents.qa_orchestrator.langgraph_workflow import latex_optimization_node
+# Node inputs shared by the inter-agent context tests. Nodes may write into
+# the state they receive, so each test works on a deep copy.
+_LATEX_NODE_STATE = {
+    "content_source": "research_report",
+    "current_version": "v1_content_edited",
+    "iterations_completed": 0,
+    "agent_context": {},
+    "agent_results": [],
+}
+_CONTENT_EDITOR_NOTES_COMPLEX_TABLES = {
+    "quality_score": 85,
+    "issues_found": [],
+    "has_complex_tables": True,
+    "readability_concerns": [],
+}
+_VISUAL_QA_NODE_STATE = {
+    "content_source": "research_report",
+    "current_version": "v2_latex_optimized",
+    "agent_context": {
+        "latex_specialist_notes": {
+            "structure_score": 23,
+            "typography_score": 15,  # weak
+            "typography_issues": ["bad spacing"],
+            "packages_used": [],
+        }
+    },
+    "agent_results": [],
+}
+
 
-        mock_coord = MagicMock()
-        MockCoordinator.return_value = mock_coord
+@pytest.fixture
+def latex_agent_mock():
+    """Patch the version manager and LaTeX specialist used by latex_optimization_node.
 
-        # Mock the LaTeX specialist agent
-        mock_agent = MagicMock()
-        mock_agent.process_with_versioning.return_value = {
+    Yields the specialist instance mock; tests set its
+    ``process_with_versioning.return_value``.
+    """
+    agent = MagicMock()
+    with ExitStack() as stack:
+        version_manager = stack.enter_context(patch("tools.version_manager.VersionManager"))
+        version_manager.return_value.get_version.return_value = None
+        stack.enter_context(patch("agents.latex_specialist.agent.LaTeXSpecialistAgent", return_value=agent))
+        yield agent
+
+
+class TestInterAgentContext:
+    @pytest.mark.coord(_coord())
+    def test_latex_node_reads_content_context_complex_tables(self, wf, latex_agent_mock):
+        """LaTeX node uses conservative optimization when complex tables flagged."""
+        latex_agent_mock.process_with_versioning.return_value = {
             "latex_analysis": {"overall_score": 90, "issues_found": 0},
             "optimizations_applied": ["optimized tables"],
         }
+        state = copy.deepcopy(_LATEX_NODE_STATE)
+        state["agent_context"]["content_editor_notes"] = copy.deepcopy(_CONTENT_EDITOR_NOTES_COMPLEX_TABLES)
+        wf.latex_optimization_node(state)
 
-        with patch("tools.version_manager.VersionManager") as MockVM:
-            MockVM.return_value.get_version.return_value = None
-
-            with patch("agents.latex_specialist.agent.LaTeXSpecialistAgent", return_value=mock_agent):
-                state = {
-                    "content_source": "research_report",
-                    "current_version": "v1_content_edited",
-                    "iterations_completed": 0,
-                    "agent_context": {
-                        "content_editor_notes": {
-                            "quality_score": 85,
-                            "issues_found": [],
-                            "has_complex_tables": True,
-                            "readability_concerns": [],
-                        }
-                    },
-                    "agent_results": [],
-                }
-                latex_optimization_node(state)
-
-                # Verify conservative optimization was used
-                mock_agent.process_with_versioning.assert_called_once()
-                call_kwargs = mock_agent.process_with_versioning.call_args
-                assert call_kwargs[1]["optimization_level"] == "conservative" or call_kwargs.kwargs.get("optimization_level") == "conservative"
-
-    @patch("agents.qa_orchestrator.langgraph_workflow.WorkflowCoordinator")
-    def test_latex_node_default_optimization_without_complex_tables(self, MockCoordinator):
-        """LaTeX node uses moderate optimization when no complex tables flagged."""
-        from agents.qa_orchestrator.langgraph_workflow import latex_optimization_node
+        # Verify conservative optimization was used
+        latex_agent_mock.process_with_versioning.assert_called_once()
+        call_kwargs = latex_agent_mock.process_with_versioning.call_args
+        assert call_kwargs[1]["optimization_level"] == "conservative" or call_kwargs.kwargs.get("optimization_level") == "conservative"
 
-        mock_coord = MagicMock()
-        MockCoordinator.return_value = mock_coord
-
-        mock_agent = MagicMock()
-        mock_agent.process_with_versioning.return_value = {
+    @pytest.mark.coord(_coord())
+    def test_latex_node_default_optimization_without_complex_tables(self, wf, latex_agent_mock):
+        """LaTeX node uses moderate optimization when no complex tables flagged."""
+        latex_agent_mock.process_with_versioning.return_value = {
             "latex_analysis": {"overall_score": 90, "issues_found": 0},
             "optimizations_applied": ["standard optimization"],
         }
+        wf.latex_optimization_node(copy.deepcopy(_LATEX_NODE_STATE))
 
-        with patch("tools.version_manager.VersionManager") as MockVM:
-            MockVM.return_value.get_version.return_value = None
-
-            with patch("agents.latex_specialist.agent.LaTeXSpecialistAgent", return_value=mock_agent):
-                state = {
-                    "content_source": "research_report",
-                    "current_version": "v1_content_edited",
-                    "iterations_completed": 0,
-                    "agent_context": {},
-                    "agent_results": [],
-                }
-                latex_optimization_node(state)
-
-                mock_agent.process_with_versioning.assert_called_once()
-                call_kwargs = mock_agent.process_with_versioning.call_args
-                assert call_kwargs[1]["optimization_level"] == "moderate" or call_kwargs.kwargs.get("optimization_level") == "moderate"
+        latex_agent_mock.process_with_versioning.assert_called_once()
+        call_kwargs = latex_agent_mock.process_with_versioning.call_args
+        assert call_kwargs[1]["optimization_level"] == "moderate" or call_kwargs.kwargs.get("optimization_level") == "moderate"
 
-    def test_visual_qa_reads_latex_context_weak_typography(self):
+    def test_visual_qa_reads_latex_context_weak_typography(self, wf):
         """Visual QA allows extra iterations when typography score is weak."""
-        from agents.qa_orchestrator.langgraph_workflow import visual_qa_node
-
-        state = {
-            "content_source": "research_report",
-            "current_version": "v2_latex_optimized",
-            "agent_context": {
-                "latex_specialist_notes": {
-                    "structure_score": 23,
-                    "typography_score": 15,  # weak
-                    "typography_issues": ["bad spacing"],
-                    "packages_used": [],
-                }
-            },
-            "agent_results": [],
-        }
+        state = copy.deepcopy(_VISUAL_QA_NODE_STATE)
 
         # The node will fail (no PDF, no visual_qa agent), but we can verify
         # the max_iterations logic by checking the result still completes
-        result = visual_qa_node(state)
+        result = wf.visual_qa_node(state)
         # Should succeed (graceful error handling) even without PDF
         assert "agent_results" in result
         assert len(result["agent_results"]) == 1
@@ -399,18 +353,7 @@ class TestAgentResultSerialization:
             metadata={"key": "value"},
         )
 
-        d = original.to_dict()
-        reconstructed = AgentResult.from_dict(d)
-
-        assert reconstructed.agent_type == original.agent_type
-        assert reconstructed.success == original.success
-        assert reconstructed.version_created == original.version_created
-        assert reconstructed.quality_score == original.quality_score
-        assert reconstructed.processing_time == original.processing_time
-        assert reconstructed.issues_found == original.issues_found
-        assert reconstructed.optimizations_applied == original.optimizations_applied
-        assert reconstructed.error_message == original.error_message
-        assert reconstructed.metadata == original.metadata
+        assert AgentResult.from_dict(original.to_dict()) == original
 
     def test_from_dict_with_minimal_data(self):
         """from_dict handles missing optional fields gracefully."""
@@ -419,13 +362,15 @@ class TestAgentResultSerialization:
             "success": False,
             "version_created": "v2_latex_optimized",
         }
-        result = AgentResult.from_dict(d)
-        assert result.agent_type == AgentType.LATEX_SPECIALIST
-        assert result.success is False
-        assert result.quality_score is None
-        assert result.processing_time == 0.0
-        assert result.issues_found == []
-        assert result.error_message is None
+        assert AgentResult.from_dict(d) == AgentResult(
+            agent_type=AgentType.LATEX_SPECIALIST,
+            success=False,
+            version_created="v2_latex_optimized",
+            quality_score=None,
+            processing_time=0.0,
+            issues_found=[],
+            optimizations_applied=[],
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -437,15 +382,12 @@ class TestAgentResultSerialization:
 # ---------------------------------------------------------------------------
 
 class TestCompilationFailureFeedback:
-    @patch("agents.qa_orchestrator.langgraph_workflow.WorkflowCoordinator")
-    def test_route_latex_iterate_on_compilation_failure(self, MockCoordinator):
-        """State with PDF_COMPILATION_FAILED issue routes to iteration."""
-        mock_coord = MagicMock()
-        mock_coord.assess_workflow_quality.return_value = QualityAssessment(
+    @pytest.mark.coord(_coord(
+        QualityAssessment(
             latex_score=90,
             latex_issues=["PDF_COMPILATION_FAILED: ! Missing \\begin{document}"],
-        )
-        mock_coord.quality_gate_manager.evaluate_latex_quality_gate.return_value = QualityGateEvaluation(
+        ),
+        evaluate_latex_quality_gate=QualityGateEvaluation(
             gate_name="latex_quality",
             result=QualityGateResult.ITERATE,
             score=90,
@@ -453,19 +395,11 @@ class TestCompilationFailureFeedback:
             reasons=["PDF compilation failed — must iterate"],
             recommendations=["Fix LaTeX compilation errors before proceeding"],
             next_action="run_latex_specialist",
-        )
-        mock_coord.quality_gate_manager.thresholds.max_iterations = 3
-        MockCoordinator.return_value = mock_coord
-
-        state = {
-            "content_source": "research_report",
-            "agent_results": [],
-            "quality_assessments": [],
-            "quality_evaluations": [],
-            "iterations_completed": 0,
-            "agent_context": {},
-        }
-        result = route_after_latex_optimization(state)
+        ),
+    ))
+    def test_route_latex_iterate_on_compilation_failure(self, wf):
+        """State with PDF_COMPILATION_FAILED issue routes to iteration."""
+        result = wf.route_after_latex_optimization({**_BASE_ROUTING_STATE})
         assert result == "iteration"
 
     def test_compilation_failure_quality_gate(self):
@@ -485,13 +419,13 @@ class TestCompilationFailureFeedback:
 
 
 class TestMergeDicts:
-    def test_merge_dicts(self):
+    @pytest.mark.parametrize(
+        "left, right, expected",
+        [
+            pytest.param({"a": 1, "b": 2}, {"b": 3, "c": 4}, {"a": 1, "b": 3, "c": 4}, id="right_overwrites_left"),
+            pytest.param({}, {"x": 1}, {"x": 1}, id="empty_left"),
+        ],
+    )
+    def test_merge_dicts(self, wf, left, right, expected):
         """merge_dicts combines two dicts, right overwrites left."""
-        left = {"a": 1, "b": 2}
-        right = {"b": 3, "c": 4}
-        result = merge_dicts(left, right)
-        assert result == {"a": 1, "b": 3, "c": 4}
-
-    def test_merge_dicts_empty(self):
-        result = merge_dicts({}, {"x": 1})
-        assert result == {"x": 1}
+        assert wf.merge_dicts(left, right) == expected
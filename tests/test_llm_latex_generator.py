@@ -0,0 +1,174 @@
+"""Tests for LLM LaTeX generation control flow.
+
+The Anthropic clients are replaced by in-process fakes, so no API key or
+network access is needed.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("anthropic")
+
+from tools.llm_latex_generator import LaTeXGenerationRequest, LLMLaTeXGenerator  # noqa: E402
+
+
+def _document(title):
+    return f"\\documentclass{{article}}\n\\begin{{document}}\n{title}\n\\end{{document}}"
+
+
+def _reply_for(params):
+    """Canned response: a document for generation calls, an issue list plus the document for validation."""
+    details = params["messages"][0]["content"]
+    title = details.split("Title: ", 1)[1].split("\n", 1)[0] if "Title: " in details else None
+    if title is not None:
+        return _document(title)
+    latex = details.split("```latex\n", 1)[1].rsplit("\n```", 1)[0]
+    return '{"issues": ["spacing"]}\n```latex\n' + latex + "\n```"
+
+
+class _FakeStream:
+    def __init__(self, client, text, delay):
+        self.client = client
+        self.text = text
+        self.delay = delay
+
+    async def __aenter__(self):
+        self.client.in_flight += 1
+        self.client.max_in_flight = max(self.client.max_in_flight, self.client.in_flight)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.client.in_flight -= 1
+
+    @property
+    async def text_stream(self):
+        # Yield control so other documents get to start their own calls
+        await asyncio.sleep(self.delay)
+        yield self.text
+
+    async def get_final_message(self):
+        return SimpleNamespace(stop_reason="end_turn")
+
+
+class _FakeAsyncClient:
+    """Stands in for anthropic.AsyncAnthropic; later documents answer faster."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+        self.messages = SimpleNamespace(stream=self._stream)
+
+    def _stream(self, **params):
+        self.calls.append(params)
+        text = _reply_for(params)
+        delay = next((d for title, d in self.delays.items() if title in text), 0)
+        return _FakeStream(self, text, delay)
+
+
+@pytest.fixture
+def generator():
+    return LLMLaTeXGenerator(api_key="test-key")
+
+
+def _requests(count):
+    return [
+        LaTeXGenerationRequest(title=f"Doc {i}", author="A", content_sections=[{"title": "S", "content": "x"}])
+        for i in range(count)
+    ]
+
+
+class TestGenerateBatch:
+    def test_keeps_request_order(self, generator):
+        """Results line up with the requests even when later documents finish first."""
+        requests = _requests(4)
+        generator.async_client = _FakeAsyncClient({f"Doc {i}": 0.01 * (4 - i) for i in range(4)})
+
+        results = asyncio.run(generator.generate_batch(requests, max_concurrency=4))
+
+        assert [r.success for r in results] == [True] * 4
+        assert [r.latex_content for r in results] == [_document(f"Doc {i}") for i in range(4)]
+        assert all(r.warnings == ["spacing"] for r in results)
+        assert generator.async_client.max_in_flight > 1
+
+    def test_respects_max_concurrency(self, generator):
+        """No more than ``max_concurrency`` documents have a call in flight at once."""
+        requests = _requests(6)
+        generator.async_client = _FakeAsyncClient({f"Doc {i}": 0.01 for i in range(6)})
+
+        results = asyncio.run(generator.generate_batch(requests, max_concurrency=2))
+
+        assert len(results) == 6
+        assert generator.async_client.max_in_flight == 2
+        # One generation and one validation call per document
+        assert len(generator.async_client.calls) == 12
+
+    def test_async_matches_sync_output(self, generator, capsys):
+        """Both entry points run the same steps and print the same progress."""
+        request = _requests(1)[0]
+        generator.async_client = _FakeAsyncClient({})
+        async_result = asyncio.run(generator.generate_document_async(request, use_cache=False))
+        async_output = capsys.readouterr().out
+
+        def sync_stream(content, max_tokens, temperature):
+            text = _reply_for({"messages": [{"content": content}]})
+            return text, "end_turn"
+
+        generator._stream_message = sync_stream
+        sync_result = generator.generate_document(request, use_cache=False)
+        sync_output = capsys.readouterr().out
+
+        assert async_result == sync_result
+        assert "🔍 Validating and improving LaTeX syntax..." in async_output
+        assert async_output == sync_output
+
+
+class TestValidationCache:
+    LATEX = _document("Cached")
+
+    def _stub(self, generator, reply, stop_reason="end_turn"):
+        calls = []
+
+        def stream(content, max_tokens, temperature):
+            calls.append(content)
+            return reply, stop_reason
+
+        generator._stream_message = stream
+        return calls
+
+    def test_reuses_complete_validation(self, generator):
+        calls = self._stub(generator, '{"issues": ["spacing"]}\n```latex\n' + self.LATEX + "\n```")
+        first = generator._validate_and_fix_latex(self.LATEX, None)
+        second = generator._validate_and_fix_latex(self.LATEX, None)
+        assert first == second == (self.LATEX, ["spacing"], ["Fixed 1 LaTeX issues"])
+        assert len(calls) == 1
+        generator._validate_and_fix_latex(self.LATEX, None, use_cache=False)
+        assert len(calls) == 2
+
+    def test_does_not_cache_missing_document(self, generator):
+        """A response without a usable document falls back to the original and is asked again next time."""
+        calls = self._stub(generator, '{"issues": ["spacing"]}\n```latex\n\\end{document}\n```')
+        assert generator._validate_and_fix_latex(self.LATEX, None) == (self.LATEX, ["spacing"], [])
+        generator._validate_and_fix_latex(self.LATEX, None)
+        assert len(calls) == 2
+
+    def test_does_not_cache_truncated_response(self, generator):
+        calls = self._stub(generator, "```latex\n" + self.LATEX, stop_reason="max_tokens")
+        generator._validate_and_fix_latex(self.LATEX, None)
+        generator._validate_and_fix_latex(self.LATEX, None)
+        assert len(calls) == 2
+
+    def test_does_not_cache_errors(self, generator):
+        calls = []
+
+        def failing(content, max_tokens, temperature):
+            calls.append(content)
+            raise RuntimeError("overloaded")
+
+        generator._stream_message = failing
+        assert generator._validate_and_fix_latex(self.LATEX, None)[1] == ["Validation failed: overloaded"]
+        generator._validate_and_fix_latex(self.LATEX, None)
+        assert len(calls) == 2
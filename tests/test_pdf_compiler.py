@@ -0,0 +1,175 @@
+"""Tests for async PDF compilation and pipelined report generation.
+
+pdflatex is replaced by a fake asyncio subprocess, so TeX Live is not needed.
+"""
+
+import asyncio
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from agents.research_agent import report_generator
+from agents.research_agent.report_generator import ResearchReportGenerator, generate_reports_pipelined
+from tools import pdf_compiler
+from tools.pdf_compiler import PDFCompiler
+
+_DOCUMENT = "\\documentclass{article}\n\\begin{document}\nHello\n\\end{document}\n"
+
+
+class _FakeProcess:
+    def __init__(self, returncode, hang):
+        self.returncode = returncode
+        self.hang = hang
+        self.killed = False
+
+    async def communicate(self):
+        if self.hang:
+            await asyncio.sleep(3600)
+        return b"output", b""
+
+    def kill(self):
+        self.killed = True
+
+    async def wait(self):
+        return self.returncode
+
+
+class _FakePdflatex:
+    """Stands in for asyncio.create_subprocess_exec running pdflatex.
+
+    A run succeeds and writes the PDF unless the .tex file contains ``FAIL``;
+    files containing ``HANG`` never finish.
+    """
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.processes = []
+        self.runs = []
+
+    async def __call__(self, program, *args, stdout=None, stderr=None):
+        assert program == "pdflatex"
+        output_dir = Path(args[args.index("-output-directory") + 1])
+        tex_path = Path(args[-1])
+        source = tex_path.read_text(encoding="utf-8")
+        self.runs.append(tex_path.parent.name)
+        await asyncio.sleep(self.delays.get(tex_path.parent.name, 0))
+
+        failed = "FAIL" in source
+        if not failed:
+            (output_dir / f"{tex_path.stem}.pdf").write_bytes(b"%PDF-1.4")
+        process = _FakeProcess(returncode=1 if failed else 0, hang="HANG" in source)
+        self.processes.append(process)
+        return process
+
+
+@pytest.fixture
+def fake_pdflatex(monkeypatch):
+    fake = _FakePdflatex()
+    monkeypatch.setattr(pdf_compiler.asyncio, "create_subprocess_exec", fake)
+    return fake
+
+
+def _write_tex(directory: Path, content: str = _DOCUMENT) -> str:
+    directory.mkdir(parents=True, exist_ok=True)
+    tex_path = directory / "research_report.tex"
+    tex_path.write_text(content, encoding="utf-8")
+    return str(tex_path)
+
+
+class TestCompileAsync:
+    def test_success(self, tmp_path, fake_pdflatex):
+        tex_file = _write_tex(tmp_path)
+        success, message = asyncio.run(PDFCompiler().compile_async(tex_file, runs=2))
+        assert success
+        assert message == f"PDF successfully created: {tmp_path / 'research_report.pdf'}"
+        assert len(fake_pdflatex.runs) == 2
+
+    def test_timeout_kills_process(self, tmp_path, fake_pdflatex, monkeypatch):
+        monkeypatch.setattr(pdf_compiler, "_COMPILE_TIMEOUT", 0.01)
+        tex_file = _write_tex(tmp_path, _DOCUMENT + "% HANG\n")
+        success, message = asyncio.run(PDFCompiler().compile_async(tex_file))
+        assert not success
+        assert message == "Compilation timed out (0.01s limit exceeded)"
+        assert [p.killed for p in fake_pdflatex.processes] == [True]
+
+    def test_missing_pdflatex(self, tmp_path, monkeypatch):
+        async def missing(*args, **kwargs):
+            raise FileNotFoundError("pdflatex")
+
+        monkeypatch.setattr(pdf_compiler.asyncio, "create_subprocess_exec", missing)
+        success, message = asyncio.run(PDFCompiler().compile_async(_write_tex(tmp_path)))
+        assert not success
+        assert message == "pdflatex not found. Please install TeX Live or MiKTeX."
+
+    def test_missing_file(self, tmp_path, fake_pdflatex):
+        success, message = asyncio.run(PDFCompiler().compile_async(str(tmp_path / "absent.tex")))
+        assert not success
+        assert message.startswith("LaTeX file not found")
+        assert fake_pdflatex.runs == []
+
+    def test_unfixable_error(self, tmp_path, fake_pdflatex):
+        """A failure that auto-fix cannot repair stops after one attempt, as in compile()."""
+        tex_file = _write_tex(tmp_path, _DOCUMENT + "% FAIL\n")
+        success, message = asyncio.run(PDFCompiler().compile_async(tex_file))
+        assert not success
+        assert message.startswith("Could not automatically fix LaTeX errors:\nCompilation failed on run 1:")
+        assert len(fake_pdflatex.runs) == 1
+
+
+class TestCompile:
+    """The sync path handles the same outcomes as compile_async."""
+
+    def test_success_and_timeout(self, tmp_path, monkeypatch):
+        def fake_run(args, capture_output, text, timeout):
+            tex_path = Path(args[-1])
+            if "HANG" in tex_path.read_text(encoding="utf-8"):
+                raise subprocess.TimeoutExpired(args, timeout)
+            (tex_path.parent / f"{tex_path.stem}.pdf").write_bytes(b"%PDF-1.4")
+            return subprocess.CompletedProcess(args, 0, "", "")
+
+        monkeypatch.setattr(pdf_compiler.subprocess, "run", fake_run)
+        assert PDFCompiler().compile(_write_tex(tmp_path / "ok"))[0]
+        assert PDFCompiler().compile(_write_tex(tmp_path / "slow", _DOCUMENT + "% HANG\n")) == (
+            False, "Compilation timed out (60s limit exceeded)"
+        )
+
+
+class _StubReportGenerator(ResearchReportGenerator):
+    """Writes a fixed .tex instead of building the sample report."""
+
+    def __init__(self, output_dir, content):
+        super().__init__(output_dir=str(output_dir))
+        self.content = content
+
+    def generate_sample_report(self) -> str:
+        return _write_tex(self.output_dir, self.content)
+
+
+class TestGenerateReportsPipelined:
+    def test_results_in_generator_order(self, tmp_path, fake_pdflatex, monkeypatch):
+        """Results follow the generators, with a failed compile between two slower successes."""
+        monkeypatch.setattr(report_generator.PDFCompiler, "validate_latex_installation",
+                            lambda self: (True, "LaTeX installed: fake"))
+        fake_pdflatex.delays = {"first": 0.05}
+        generators = [
+            _StubReportGenerator(tmp_path / "first", _DOCUMENT),
+            _StubReportGenerator(tmp_path / "second", _DOCUMENT + "% FAIL\n"),
+            _StubReportGenerator(tmp_path / "third", _DOCUMENT),
+        ]
+
+        results = asyncio.run(generate_reports_pipelined(generators))
+
+        assert results == [True, False, True]
+        assert (tmp_path / "first" / "research_report.pdf").exists()
+        assert not (tmp_path / "second" / "research_report.pdf").exists()
+
+    def test_missing_latex_installation(self, tmp_path, fake_pdflatex, monkeypatch):
+        monkeypatch.setattr(report_generator.PDFCompiler, "validate_latex_installation",
+                            lambda self: (False, "pdflatex not found"))
+        results = asyncio.run(generate_reports_pipelined([_StubReportGenerator(tmp_path / "only", _DOCUMENT)]))
+        assert results == [False]
+        assert fake_pdflatex.runs == []
+
+    def test_empty(self):
+        assert asyncio.run(generate_reports_pipelined([])) == []
@@ -3,12 +3,7 @@
 All tests run without Docker, TeX Live, or API keys.
 """
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from agents.qa_orchestrator.quality_gates import (  # noqa: E402
+from agents.qa_orchestrator.quality_gates import (
     QualityAssessment,
     QualityGateResult,
 )
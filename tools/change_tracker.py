@@ -4,12 +4,226 @@ Change Tracker - Milestone 2
 Tracks changes between content versions and generates detailed comparison reports.
 """
 
+import contextlib
 import difflib
 import json
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Line counts above which unified diffs use the Myers O(ND) algorithm instead
+# of difflib, and the edit distance beyond which it gives up (files that
+# different are effectively rewrites, where difflib's heuristics are cheaper).
+# Myers' cost grows with D squared, so past a few hundred edits difflib wins
+# even on large files.
+_MYERS_MIN_LINES = 2000
+_MYERS_MAX_EDIT_DISTANCE = 200
+
+# Leading unified diff lines kept in memory for the markdown summary
+_SAMPLE_DIFF_LINES = 10
+
+# compare_versions diffs modified files in worker processes only when there
+# are enough of them, and enough text, to outweigh starting the pool.
+_PARALLEL_MIN_FILES = 4
+_PARALLEL_MIN_CHARS = 500_000
+
+
+def _myers_opcodes(a: List[str], b: List[str],
+                   max_d: int = _MYERS_MAX_EDIT_DISTANCE) -> Optional[List[Tuple[str, int, int, int, int]]]:
+    """
+    Shortest edit script between two line lists (Myers 1986, greedy forward pass).
+
+    Returns SequenceMatcher-style opcodes, or None if the edit distance
+    exceeds ``max_d``.
+    """
+    n, m = len(a), len(b)
+
+    # Common leading and trailing lines never take part in the edit script
+    prefix = 0
+    while prefix < n and prefix < m and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < n - prefix and suffix < m - prefix and a[n - 1 - suffix] == b[m - 1 - suffix]:
+        suffix += 1
+    a_mid, b_mid = a[prefix:n - suffix], b[prefix:m - suffix]
+    n_mid, m_mid = len(a_mid), len(b_mid)
+
+    # Forward pass. Each diagonal remembers the furthest x reached and the
+    # path that got there. Paths are linked lists of moves stored in flat
+    # parallel arrays (move end x, diagonal, index of the previous move), so
+    # extending a path is an O(1) append and no per-step state is copied.
+    # Diagonal k lives at index k + offset of two lists allocated once.
+    move_x = array("l", [0])
+    move_k = array("l", [0])
+    move_prev = array("l", [-1])
+    add_x, add_k, add_prev = move_x.append, move_k.append, move_prev.append
+    move_count = 1
+    d_limit = min(n_mid + m_mid, max_d)
+    offset = d_limit + 1
+    v = [0] * (2 * offset + 1)
+    paths = [0] * (2 * offset + 1)
+    for d in range(d_limit + 1):
+        for i in range(offset - d, offset + d + 1, 2):
+            if i == offset - d or (i != offset + d and v[i - 1] < v[i + 1]):
+                x = v[i + 1]
+                path = paths[i + 1]
+            else:
+                x = v[i - 1] + 1
+                path = paths[i - 1]
+            k = i - offset
+            if d:
+                add_x(x)
+                add_k(k)
+                add_prev(path)
+                path = move_count
+                move_count += 1
+            y = x - k
+            while x < n_mid and y < m_mid and a_mid[x] == b_mid[y]:
+                x += 1
+                y += 1
+            v[i] = x
+            paths[i] = path
+            if x >= n_mid and y >= m_mid:
+                break
+        else:
+            continue
+        break
+    else:
+        if n_mid or m_mid:
+            return None
+
+    # Walk the winning path back to the start; index 0 is the origin
+    moves = []
+    while path > 0:
+        k = move_k[path]
+        prev = move_prev[path]
+        moves.append((move_x[path], move_x[path] - k, move_k[prev] == k + 1))
+        path = prev
+    moves.reverse()
+
+    # Turn the moves into opcodes: the gaps between them are equal runs and
+    # adjacent moves merge into one replace/delete/insert block
+    opcodes = []
+    if prefix:
+        opcodes.append(("equal", 0, prefix, 0, prefix))
+
+    def flush_block(block_x, block_y, end_x, end_y):
+        deleted, inserted = end_x - block_x, end_y - block_y
+        tag = "replace" if deleted and inserted else ("delete" if deleted else "insert")
+        opcodes.append((tag, prefix + block_x, prefix + end_x, prefix + block_y, prefix + end_y))
+
+    x = y = 0
+    block = None
+    for to_x, to_y, is_insert in moves:
+        start_x, start_y = (to_x, to_y - 1) if is_insert else (to_x - 1, to_y)
+        if start_x > x:
+            if block is not None:
+                flush_block(*block, x, y)
+                block = None
+            opcodes.append(("equal", prefix + x, prefix + start_x, prefix + y, prefix + start_y))
+        if block is None:
+            block = (start_x, start_y)
+        x, y = to_x, to_y
+    if block is not None:
+        flush_block(*block, x, y)
+    if x < n_mid:
+        opcodes.append(("equal", prefix + x, prefix + n_mid, prefix + y, prefix + m_mid))
+    if suffix:
+        opcodes.append(("equal", n - suffix, n, m - suffix, m))
+    return opcodes or [("equal", 0, 0, 0, 0)]
+
+
+def _group_opcodes(opcodes: List[Tuple[str, int, int, int, int]], n: int = 3):
+    """Split opcodes into hunks with ``n`` lines of context (as SequenceMatcher.get_grouped_opcodes)."""
+    codes = list(opcodes)
+    if not codes:
+        codes = [("equal", 0, 1, 0, 1)]
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    nn = n + n
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > nn:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _format_range_unified(start: int, stop: int) -> str:
+    """Convert a range to the unified diff ``start,length`` format."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _diff_opcodes(a: List[str], b: List[str]) -> List[Tuple[str, int, int, int, int]]:
+    """
+    Line alignment of two line lists as SequenceMatcher-style opcodes.
+
+    Large inputs are aligned with Myers' algorithm; everything else, and
+    inputs too different for it, go through difflib.
+    """
+    opcodes = None
+    if max(len(a), len(b)) > _MYERS_MIN_LINES:
+        opcodes = _myers_opcodes(a, b)
+    if opcodes is None:
+        opcodes = difflib.SequenceMatcher(None, a, b).get_opcodes()
+    return opcodes
+
+
+def _similarity_ratio(opcodes: List[Tuple[str, int, int, int, int]], old_count: int, new_count: int) -> float:
+    """Line similarity (2 * matched lines / total lines) of an alignment."""
+    total = old_count + new_count
+    if not total:
+        return 1.0
+    matches = sum(i2 - i1 for tag, i1, i2, _, _ in opcodes if tag == "equal")
+    return 2.0 * matches / total
+
+
+def _unified_diff_lines(a: List[str], b: List[str], opcodes: List[Tuple[str, int, int, int, int]],
+                        fromfile: str, tofile: str, n: int = 3):
+    """Unified diff of two line lists from their opcodes, matching difflib.unified_diff(lineterm="")."""
+    started = False
+    for group in _group_opcodes(opcodes, n):
+        if not started:
+            started = True
+            yield f"--- {fromfile}"
+            yield f"+++ {tofile}"
+        first, last = group[0], group[-1]
+        yield f"@@ -{_format_range_unified(first[1], last[2])} +{_format_range_unified(first[3], last[4])} @@"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in a[i1:i2]:
+                    yield " " + line
+                continue
+            if tag in ("replace", "delete"):
+                for line in a[i1:i2]:
+                    yield "-" + line
+            if tag in ("replace", "insert"):
+                for line in b[j1:j2]:
+                    yield "+" + line
+
 
 class ChangeTracker:
     """
@@ -41,7 +255,9 @@ class ChangeTracker:
     def generate_diff(self,
                      old_content: str,
                      new_content: str,
-                     filename: str = "content") -> Dict:
+                     filename: str = "content",
+                     include_html: bool = False,
+                     diff_path: Optional[Path] = None) -> Dict:
         """
         Generate a detailed diff between two text contents.
 
@@ -49,46 +265,88 @@ class ChangeTracker:
             old_content: Original content
             new_content: Modified content
             filename: Name of the file being compared
+            include_html: Also render a side-by-side HTML table (``html_diff``);
+                this is quadratic in the file length, so it is off by default
+            diff_path: If given, the unified diff is written to this file as
+                it is generated
 
         Returns:
-            Dictionary containing diff information
+            Dictionary containing diff information. Only the first few diff
+            lines are kept (``sample_diff_lines``); pass ``diff_path`` to keep
+            the full diff.
         """
-        # Split content into lines
+        # Unchanged files (the common case in a version bump) need no diffing
+        if old_content == new_content and not include_html:
+            if diff_path is not None:
+                Path(diff_path).write_text("", encoding='utf-8')
+            line_count = len(old_content.splitlines())
+            return {
+                "filename": filename,
+                "sample_diff_lines": [],
+                "diff_line_count": 0,
+                "html_diff": None,
+                "similarity_ratio": 1.0,
+                "statistics": {
+                    "additions": 0,
+                    "deletions": 0,
+                    "modifications": 0,
+                    "total_changes": 0,
+                    "similarity_percentage": 100.0
+                },
+                "old_line_count": line_count,
+                "new_line_count": line_count,
+                "line_change": 0
+            }
+
+        # Split content into lines and align them once; the unified diff and
+        # the similarity ratio are both read off the same opcodes
         old_lines = old_content.splitlines(keepends=True)
         new_lines = new_content.splitlines(keepends=True)
-
-        # Generate unified diff
-        unified_diff = list(difflib.unified_diff(
-            old_lines,
-            new_lines,
-            fromfile=f"{filename} (old)",
-            tofile=f"{filename} (new)",
-            lineterm=""
-        ))
-
-        # Generate HTML diff
-        html_diff = difflib.HtmlDiff()
-        html_table = html_diff.make_table(
-            old_lines,
-            new_lines,
-            fromdesc=f"{filename} (old)",
-            todesc=f"{filename} (new)"
-        )
+        opcodes = _diff_opcodes(old_lines, new_lines)
+
+        # Generate the unified diff, counting changes and writing it out in
+        # the same pass; only a short sample stays in memory
+        sample_diff_lines = []
+        diff_line_count = additions = deletions = 0
+        with contextlib.ExitStack() as stack:
+            diff_file = None
+            if diff_path is not None:
+                diff_file = stack.enter_context(open(diff_path, 'w', encoding='utf-8'))
+            for line in _unified_diff_lines(
+                old_lines,
+                new_lines,
+                opcodes,
+                fromfile=f"{filename} (old)",
+                tofile=f"{filename} (new)"
+            ):
+                marker = line[:1]
+                if diff_line_count < _SAMPLE_DIFF_LINES and marker in ('+', '-', '@'):
+                    sample_diff_lines.append(line)
+                # The first two lines are the ---/+++ file headers; after them
+                # every +/- line is a change, even if its text starts with ++/--
+                if diff_line_count >= 2:
+                    if marker == '+':
+                        additions += 1
+                    elif marker == '-':
+                        deletions += 1
+                diff_line_count += 1
+                if diff_file is not None:
+                    diff_file.write(line)
+
+        # Generate HTML diff only when asked for
+        html_table = self.generate_html_diff(old_content, new_content, filename) if include_html else None
 
         # Calculate statistics
-        differ = difflib.SequenceMatcher(None, old_content, new_content)
-        similarity_ratio = differ.ratio()
+        similarity_ratio = _similarity_ratio(opcodes, len(old_lines), len(new_lines))
 
-        # Count changes
-        additions = sum(1 for line in unified_diff if line.startswith('+') and not line.startswith('+++'))
-        deletions = sum(1 for line in unified_diff if line.startswith('-') and not line.startswith('---'))
         modifications = min(additions, deletions)
         net_additions = additions - modifications
         net_deletions = deletions - modifications
 
         return {
             "filename": filename,
-            "unified_diff": unified_diff,
+            "sample_diff_lines": sample_diff_lines,
+            "diff_line_count": diff_line_count,
             "html_diff": html_table,
             "similarity_ratio": similarity_ratio,
             "statistics": {
@@ -103,11 +361,34 @@ class ChangeTracker:
             "line_change": len(new_lines) - len(old_lines)
         }
 
+    def generate_html_diff(self,
+                          old_content: str,
+                          new_content: str,
+                          filename: str = "content") -> str:
+        """
+        Render a side-by-side HTML diff table between two text contents.
+
+        Args:
+            old_content: Original content
+            new_content: Modified content
+            filename: Name of the file being compared
+
+        Returns:
+            HTML table markup
+        """
+        return difflib.HtmlDiff().make_table(
+            old_content.splitlines(keepends=True),
+            new_content.splitlines(keepends=True),
+            fromdesc=f"{filename} (old)",
+            todesc=f"{filename} (new)"
+        )
+
     def compare_versions(self,
                         old_content_dict: Dict[str, str],
                         new_content_dict: Dict[str, str],
                         old_version: str,
-                        new_version: str) -> Dict:
+                        new_version: str,
+                        write_diffs: bool = False) -> Dict:
         """
         Compare two complete versions and generate comprehensive change analysis.
 
@@ -116,6 +397,8 @@ class ChangeTracker:
             new_content_dict: Content of the new version
             old_version: Name of the old version
             new_version: Name of the new version
+            write_diffs: Stream each modified file's unified diff into the
+                diffs directory while it is generated
 
         Returns:
             Complete comparison report
@@ -149,12 +432,19 @@ class ChangeTracker:
         comparison["summary"]["files_removed"] = list(removed_files)
 
         # Analyze common files
+        diff_paths = {
+            filename: self._diff_path(filename, old_version, new_version) if write_diffs else None
+            for filename in common_files
+        }
+        diff_results = self._diff_modified_in_parallel(old_content_dict, new_content_dict, common_files, diff_paths)
         similarities = []
         for filename in common_files:
             old_content = old_content_dict[filename]
             new_content = new_content_dict[filename]
 
-            diff_result = self.generate_diff(old_content, new_content, filename)
+            diff_result = diff_results.get(filename)
+            if diff_result is None:
+                diff_result = self.generate_diff(old_content, new_content, filename, diff_path=diff_paths[filename])
             comparison["file_changes"][filename] = diff_result
 
             # Check if file was actually modified
@@ -208,15 +498,44 @@ class ChangeTracker:
 
         return comparison
 
-    def save_comparison(self,
-                       comparison: Dict,
-                       save_diffs: bool = True) -> Tuple[str, str]:
+    def _diff_modified_in_parallel(self,
+                                   old_content_dict: Dict[str, str],
+                                   new_content_dict: Dict[str, str],
+                                   common_files: set,
+                                   diff_paths: Dict[str, Optional[Path]]) -> Dict[str, Dict]:
+        """
+        Diff the modified common files across worker processes.
+
+        Returns:
+            Dictionary of filename -> generate_diff result, empty when the
+            work is too small to be worth a process pool
+        """
+        modified = [f for f in common_files if old_content_dict[f] != new_content_dict[f]]
+        workers = min(len(modified), os.cpu_count() or 1)
+        if (len(modified) < _PARALLEL_MIN_FILES or workers < 2
+                or sum(len(new_content_dict[f]) for f in modified) < _PARALLEL_MIN_CHARS):
+            return {}
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                self.generate_diff,
+                [old_content_dict[f] for f in modified],
+                [new_content_dict[f] for f in modified],
+                modified,
+                [False] * len(modified),
+                [diff_paths[f] for f in modified],
+            )
+            return dict(zip(modified, results))
+
+    def save_comparison(self, comparison: Dict) -> Tuple[str, str]:
         """
         Save a comparison report to disk.
 
+        Comparisons only carry a sample of each diff; the full diff files are
+        written by compare_versions(write_diffs=True).
+
         Args:
             comparison: Comparison result from compare_versions
-            save_diffs: Whether to save individual diff files
 
         Returns:
             Tuple of (comparison_file_path, summary_file_path)
@@ -228,18 +547,12 @@ class ChangeTracker:
         comparison_filename = f"{old_version}_to_{new_version}.json"
         comparison_path = self.changes_dir / comparison_filename
 
-        with open(comparison_path, 'w', encoding='utf-8') as f:
-            json.dump(comparison, f, indent=2, ensure_ascii=False)
-
-        # Save individual diff files if requested
-        if save_diffs:
-            for filename, change_info in comparison["file_changes"].items():
-                if "unified_diff" in change_info:
-                    diff_filename = f"{filename}_{old_version}_{new_version}.diff"
-                    diff_path = self.diffs_dir / diff_filename
-
-                    with open(diff_path, 'w', encoding='utf-8') as f:
-                        f.writelines(change_info["unified_diff"])
+        # orjson, when installed, writes the same layout as the json fallback
+        if orjson is not None:
+            comparison_path.write_bytes(orjson.dumps(comparison, option=orjson.OPT_INDENT_2))
+        else:
+            with open(comparison_path, 'w', encoding='utf-8') as f:
+                json.dump(comparison, f, indent=2, ensure_ascii=False)
 
         # Create human-readable summary
         summary_filename = f"{old_version}_to_{new_version}_summary.md"
@@ -248,13 +561,20 @@ class ChangeTracker:
 
         return str(comparison_path), str(summary_path)
 
+    def _diff_path(self, filename: str, old_version: str, new_version: str) -> Path:
+        """Path of the saved unified diff for one file of a comparison."""
+        return self.diffs_dir / f"{filename}_{old_version}_{new_version}.diff"
+
     def _create_summary_markdown(self, comparison: Dict, output_path: Path):
         """Create a human-readable markdown summary of changes."""
         old_version = comparison["old_version"]
         new_version = comparison["new_version"]
         summary = comparison["summary"]
 
-        content = f"""# Change Summary: {old_version} → {new_version}
+        # Stream the report straight to the file rather than growing one string
+        with open(output_path, 'w', encoding='utf-8') as f:
+            write = f.write
+            write(f"""# Change Summary: {old_version} → {new_version}
 
 **Generated:** {comparison["comparison_timestamp"]}
 
@@ -270,53 +590,48 @@ class ChangeTracker:
 | Net Change | {summary["total_additions"] - summary["total_deletions"]:+d} lines |
 | Average Similarity | {summary["average_similarity"]}% |
 
-"""
-
-        # Files added
-        if summary["files_added"]:
-            content += "## Files Added\n\n"
-            for filename in summary["files_added"]:
-                file_info = comparison["file_changes"][filename]
-                content += f"- **{filename}** (+{file_info['statistics']['additions']} lines)\n"
-            content += "\n"
-
-        # Files removed
-        if summary["files_removed"]:
-            content += "## Files Removed\n\n"
-            for filename in summary["files_removed"]:
-                file_info = comparison["file_changes"][filename]
-                content += f"- **{filename}** (-{file_info['statistics']['deletions']} lines)\n"
-            content += "\n"
-
-        # Files modified
-        if summary["files_modified"]:
-            content += "## Files Modified\n\n"
-            for filename in summary["files_modified"]:
-                file_info = comparison["file_changes"][filename]
-                stats = file_info["statistics"]
-                similarity = stats["similarity_percentage"]
-
-                content += f"### {filename}\n"
-                content += f"- **Similarity:** {similarity}%\n"
-                content += f"- **Changes:** +{stats['additions']} -{stats['deletions']} lines\n"
-                content += f"- **Modifications:** {stats['modifications']} lines\n"
-
-                # Add sample changes if available
-                if "unified_diff" in file_info and file_info["unified_diff"]:
-                    content += "- **Sample changes:**\n"
-                    content += "  ```diff\n"
-                    # Show first few diff lines
-                    diff_lines = file_info["unified_diff"][:10]
-                    for line in diff_lines:
-                        if line.startswith(('+', '-', '@')):
-                            content += f"  {line.rstrip()}\n"
-                    if len(file_info["unified_diff"]) > 10:
-                        content += "  ...\n"
-                    content += "  ```\n"
-                content += "\n"
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+""")
+
+            # Files added
+            if summary["files_added"]:
+                write("## Files Added\n\n")
+                for filename in summary["files_added"]:
+                    file_info = comparison["file_changes"][filename]
+                    write(f"- **{filename}** (+{file_info['statistics']['additions']} lines)\n")
+                write("\n")
+
+            # Files removed
+            if summary["files_removed"]:
+                write("## Files Removed\n\n")
+                for filename in summary["files_removed"]:
+                    file_info = comparison["file_changes"][filename]
+                    write(f"- **{filename}** (-{file_info['statistics']['deletions']} lines)\n")
+                write("\n")
+
+            # Files modified
+            if summary["files_modified"]:
+                write("## Files Modified\n\n")
+                for filename in summary["files_modified"]:
+                    file_info = comparison["file_changes"][filename]
+                    stats = file_info["statistics"]
+                    similarity = stats["similarity_percentage"]
+
+                    write(f"### {filename}\n")
+                    write(f"- **Similarity:** {similarity}%\n")
+                    write(f"- **Changes:** +{stats['additions']} -{stats['deletions']} lines\n")
+                    write(f"- **Modifications:** {stats['modifications']} lines\n")
+
+                    # Add sample changes if available
+                    if file_info.get("sample_diff_lines"):
+                        write("- **Sample changes:**\n")
+                        write("  ```diff\n")
+                        # Show first few diff lines
+                        for line in file_info["sample_diff_lines"]:
+                            write(f"  {line.rstrip()}\n")
+                        if file_info["diff_line_count"] > _SAMPLE_DIFF_LINES:
+                            write("  ...\n")
+                        write("  ```\n")
+                    write("\n")
 
     def analyze_quality_progression(self, version_qualities: List[Tuple[str, int]]) -> Dict:
         """
@@ -340,7 +655,10 @@ class ChangeTracker:
             "improvement_trend": "unknown"
         }
 
-        # Calculate progression
+        # Calculate progression, tracking the best and worst versions and
+        # the trend counts in the same pass
+        best = worst = version_qualities[0]
+        positive_steps = negative_steps = 0
         for i in range(1, len(version_qualities)):
             prev_version, prev_score = version_qualities[i-1]
             curr_version, curr_score = version_qualities[i]
@@ -354,22 +672,26 @@ class ChangeTracker:
                 "to_score": curr_score
             })
 
+            if improvement > 0:
+                positive_steps += 1
+            elif improvement < 0:
+                negative_steps += 1
+            # Strict comparisons keep the earliest version on ties
+            if curr_score > best[1]:
+                best = version_qualities[i]
+            if curr_score < worst[1]:
+                worst = version_qualities[i]
+
         # Overall metrics
         first_score = version_qualities[0][1]
         last_score = version_qualities[-1][1]
         analysis["overall_improvement"] = last_score - first_score
 
         # Best and worst versions
-        best_score = max(version_qualities, key=lambda x: x[1])
-        worst_score = min(version_qualities, key=lambda x: x[1])
-        analysis["best_version"] = {"name": best_score[0], "score": best_score[1]}
-        analysis["worst_version"] = {"name": worst_score[0], "score": worst_score[1]}
+        analysis["best_version"] = {"name": best[0], "score": best[1]}
+        analysis["worst_version"] = {"name": worst[0], "score": worst[1]}
 
         # Determine trend
-        improvements = [step["improvement"] for step in analysis["quality_progression"]]
-        positive_steps = sum(1 for imp in improvements if imp > 0)
-        negative_steps = sum(1 for imp in improvements if imp < 0)
-
         if positive_steps > negative_steps:
             analysis["improvement_trend"] = "improving"
         elif negative_steps > positive_steps:
@@ -400,8 +722,8 @@ class ChangeTracker:
         Returns:
             Path to the generated report
         """
-        # Generate comparison
-        comparison = self.compare_versions(old_content, new_content, old_version, new_version)
+        # Generate comparison, writing the diff files as they are produced
+        comparison = self.compare_versions(old_content, new_content, old_version, new_version, write_diffs=True)
 
         # Add quality information if provided
         if old_quality is not None and new_quality is not None:
@@ -411,7 +733,7 @@ class ChangeTracker:
                 "quality_improvement": new_quality - old_quality
             }
 
-        # Save comparison
+        # Save comparison (the diff files are already on disk)
         comparison_path, summary_path = self.save_comparison(comparison)
 
         return summary_path
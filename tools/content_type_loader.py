@@ -8,58 +8,57 @@ Provides structured metadata for DocumentConfig and raw markdown for LLM prompts
 import logging
 import re
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+_RENDERING_INSTRUCTIONS_RE = re.compile(r'## Rendering Instructions\s*\n(.*?)(?=\n## |\Z)', re.DOTALL)
+_LATEX_REQUIREMENTS_RE = re.compile(r'## LaTeX Requirements\s*\n(.*?)(?=\n## |\Z)', re.DOTALL)
+_LATEX_BLOCK_RE = re.compile(r'```latex\s*\n(.*?)```', re.DOTALL)
+_STRUCTURE_RULES_RE = re.compile(r'## Structure Rules\s*\n(.*?)(?=\n## |\Z)', re.DOTALL)
+
 
 @dataclass
 class ContentTypeDefinition:
-    """A loaded content type definition."""
+    """
+    A loaded content type definition.
+
+    The section properties are parsed on first access and cached on the
+    instance, so treat ``type_md_content`` as read-only once loaded.
+    """
     type_id: str
     type_md_content: str        # Full type.md — goes to LLM as-is
     document_class: str         # Extracted for DocumentConfig
     default_font_size: str      # Extracted for DocumentConfig
     default_paper_size: str     # Extracted for DocumentConfig
 
-    @property
+    @cached_property
     def rendering_instructions(self) -> str:
         """Extract the ## Rendering Instructions section text."""
         if not self.type_md_content:
             return ""
-        match = re.search(
-            r'## Rendering Instructions\s*\n(.*?)(?=\n## |\Z)',
-            self.type_md_content,
-            re.DOTALL
-        )
+        match = _RENDERING_INSTRUCTIONS_RE.search(self.type_md_content)
         return match.group(1).strip() if match else ""
 
-    @property
+    @cached_property
     def latex_preamble_blocks(self) -> List[str]:
         """Extract all ```latex code blocks from the ## LaTeX Requirements section."""
         if not self.type_md_content:
             return []
-        section_match = re.search(
-            r'## LaTeX Requirements\s*\n(.*?)(?=\n## |\Z)',
-            self.type_md_content,
-            re.DOTALL
-        )
+        section_match = _LATEX_REQUIREMENTS_RE.search(self.type_md_content)
         if not section_match:
             return []
         section_text = section_match.group(1)
-        return re.findall(r'```latex\s*\n(.*?)```', section_text, re.DOTALL)
+        return _LATEX_BLOCK_RE.findall(section_text)
 
-    @property
+    @cached_property
     def structure_rules(self) -> str:
         """Extract the ## Structure Rules section text."""
         if not self.type_md_content:
             return ""
-        match = re.search(
-            r'## Structure Rules\s*\n(.*?)(?=\n## |\Z)',
-            self.type_md_content,
-            re.DOTALL
-        )
+        match = _STRUCTURE_RULES_RE.search(self.type_md_content)
         return match.group(1).strip() if match else ""
 
 
@@ -72,8 +71,14 @@ class ContentTypeLoader:
     - Rendering Instructions for LLM consumption
     - LaTeX Requirements for package/preamble info
     - Structure Rules for compilation constraints
+
+    Definitions are cached per (types_dir, type_id) for the life of the
+    process and shared between loader instances, so edits to a type.md are
+    only picked up after clear_cache().
     """
 
+    _cache: Dict[Tuple[Path, str], ContentTypeDefinition] = {}
+
     def __init__(self, types_dir: Optional[str] = None):
         if types_dir is not None:
             self.types_dir = Path(types_dir)
@@ -91,6 +96,22 @@ class ContentTypeLoader:
         Returns:
             ContentTypeDefinition with metadata and full markdown content
         """
+        cache_key = (self.types_dir, type_id)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        definition = self._read_type(type_id)
+        self._cache[cache_key] = definition
+        return definition
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget all loaded definitions so the next load_type re-reads type.md."""
+        cls._cache.clear()
+
+    def _read_type(self, type_id: str) -> ContentTypeDefinition:
+        """Read and parse type.md for ``type_id``, falling back to defaults if it is missing."""
         type_path = self.types_dir / type_id / "type.md"
 
         if not type_path.exists():
@@ -146,26 +167,32 @@ class ContentTypeLoader:
         """
         metadata = {}
 
-        # Find the Type Metadata section
-        in_metadata = False
-        for line in content.split('\n'):
+        # Jump to the Type Metadata heading instead of scanning every line
+        # before it; the match must be the whole (stripped) line
+        start = 0
+        while True:
+            start = content.find('## Type Metadata', start)
+            if start < 0:
+                return metadata
+            line_start = content.rfind('\n', 0, start) + 1
+            line_end = content.find('\n', start)
+            if line_end < 0:
+                line_end = len(content)
+            if content[line_start:line_end].strip() == '## Type Metadata':
+                break
+            start = line_end
+
+        for line in content[line_end + 1:].split('\n'):
             stripped = line.strip()
 
-            if stripped == '## Type Metadata':
-                in_metadata = True
-                continue
-
-            if in_metadata:
-                # Stop at next section header
-                if stripped.startswith('## '):
-                    break
-
-                # Parse "- key: value" lines
-                if stripped.startswith('- ') and ':' in stripped:
-                    key_value = stripped[2:].split(':', 1)
-                    if len(key_value) == 2:
-                        key = key_value[0].strip()
-                        value = key_value[1].strip()
-                        metadata[key] = value
+            # Stop at next section header
+            if stripped.startswith('## '):
+                break
+
+            # Parse "- key: value" lines
+            if stripped.startswith('- '):
+                key, sep, value = stripped[2:].partition(':')
+                if sep:
+                    metadata[key.strip()] = value.strip()
 
         return metadata
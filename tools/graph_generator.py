@@ -1,29 +1,113 @@
 """Graph Generator for Magazine Data Visualizations."""
 
+import csv
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import matplotlib
 import matplotlib.pyplot as plt
-import pandas as pd
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from PIL import Image
 
 matplotlib.use('Agg')  # Non-interactive backend
 
 # Set style for magazine-quality charts
 plt.style.use('seaborn-v0_8-whitegrid')
 
+# Series colors, in order
+_COLOR_LIST = ('#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#3B1F2B', '#5C946E')
+
+# The same colors parsed to RGBA once, so bars don't re-parse hex strings
+_PALETTE_RGBA = tuple(to_rgba(color) for color in _COLOR_LIST)
+
+# Chart file formats; pdf and svg are vector and accepted by \includegraphics
+_OUTPUT_FORMATS = ("png", "pdf", "svg")
+
+# zlib level for PNG charts (PIL's default is 6)
+_PNG_COMPRESS_LEVEL = 3
+
+
+@dataclass(slots=True, frozen=True)
+class ChartData:
+    """A small CSV table: header row, first-column labels and the remaining cells as text."""
+    headers: List[str]
+    labels: List[str]
+    cells: np.ndarray  # str array of shape (len(labels), len(headers) - 1)
+
+    def values(self, *columns: str) -> np.ndarray:
+        """
+        Return the named columns (default: all but the label column) as floats.
+
+        Args:
+            columns: Header names of the columns to convert
+
+        Returns:
+            Float array with one row per label and one column per name
+        """
+        if not columns:
+            return self.cells.astype(float)
+        return self.cells[:, [self.headers.index(name) - 1 for name in columns]].astype(float)
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a single named column as a 1-D float array."""
+        return self.values(name)[:, 0]
+
+
+def _load_csv(path: Path) -> ChartData:
+    """
+    Parse a chart CSV with the stdlib reader.
+
+    The chart tables are a handful of rows, so this skips pandas and its
+    import and type-inference cost entirely.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        headers = next(reader)
+        rows = [row for row in reader if row]
+    labels = [row[0] for row in rows]
+    cells = np.array([row[1:] for row in rows], dtype=str).reshape(len(rows), len(headers) - 1)
+    return ChartData(headers, labels, cells)
+
+
+def _write_png(rgba: np.ndarray, output_path: Path, dpi: int):
+    """
+    Encode an RGBA pixel buffer as a PNG.
+
+    PIL releases the GIL while compressing, so this can run on a worker
+    thread. A lower zlib level than the default roughly halves the
+    compression time for files about 10% larger.
+    """
+    Image.fromarray(rgba).save(output_path, 'PNG', compress_level=_PNG_COMPRESS_LEVEL, dpi=(dpi, dpi))
+
 
 class GraphGenerator:
     """Generate publication-quality graphs from CSV data."""
 
-    def __init__(self, output_dir: str = "artifacts/sample_content/magazine/images"):
+    def __init__(self, output_dir: str = "artifacts/sample_content/magazine/images", dpi: int = 150,
+                 output_format: str = "png"):
         """
         Initialize graph generator.
 
         Args:
             output_dir: Directory to save generated graphs
+            dpi: Resolution charts are rendered at; render cost grows with
+                its square, so previews can use less than the print pass
+            output_format: Chart file format, one of "png", "pdf" or "svg";
+                the vector formats skip rasterization and stay sharp in print
         """
+        if output_format not in _OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format {output_format!r}; expected one of {_OUTPUT_FORMATS}")
         self.output_dir = Path(output_dir)
+        self.dpi = dpi
+        self.output_format = output_format
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         # Magazine color palette
@@ -36,37 +120,149 @@ class GraphGenerator:
             'light': '#E8E8E8',
             'dark': '#1A1A2E'
         }
-        self.color_list = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#3B1F2B', '#5C946E']
+        self.color_list = list(_COLOR_LIST)
+        self._palette = _PALETTE_RGBA
+
+        # Figures reused across charts of the same shape, keyed by
+        # (figsize, dpi, nrows, ncols); released by close_all()
+        self._fig_pool = {}
+
+        # Parsed CSVs keyed by resolved path, with the mtime they were read
+        # at, so charts sharing a data file parse it once and edits are re-read
+        self._csv_cache = {}
+
+        # Background PNG encoder and its outstanding writes; only set while
+        # generate_all_charts renders charts in this process
+        self._png_writer = None
+        self._png_writes = []
+
+    def __getstate__(self):
+        """Leave pooled figures, cached CSVs and the PNG writer behind when pickled (e.g. for worker processes)."""
+        state = self.__dict__.copy()
+        state["_fig_pool"] = {}
+        state["_csv_cache"] = {}
+        state["_png_writer"] = None
+        state["_png_writes"] = []
+        return state
+
+    def _output_path(self, output_name: Optional[str], chart_name: str) -> Path:
+        """Resolve a chart's output path, naming it after the chart and format by default."""
+        return self.output_dir / (output_name or f"{chart_name}.{self.output_format}")
+
+    def _save(self, fig: Figure, output_path: Path):
+        """
+        Write a finished figure in the configured format.
+
+        PNGs are drawn here but, while a background writer is active, encoded
+        on its thread so compression overlaps drawing the next chart.
+        """
+        if self.output_format != "png":
+            fig.savefig(output_path, format=self.output_format)
+            return
+
+        fig.canvas.draw()
+        if self._png_writer is None:
+            _write_png(np.asarray(fig.canvas.buffer_rgba()), output_path, self.dpi)
+        else:
+            # Copy the pixels out, since the pooled figure is redrawn by the next chart
+            rgba = np.array(fig.canvas.buffer_rgba())
+            self._png_writes.append(self._png_writer.submit(_write_png, rgba, output_path, self.dpi))
+
+    def _is_up_to_date(self, csv_path: str, output_path: Path) -> bool:
+        """Whether ``output_path`` exists at this DPI and is newer than its CSV and this module."""
+        try:
+            output_mtime = os.stat(output_path).st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if output_mtime < max(os.stat(csv_path).st_mtime_ns, os.stat(__file__).st_mtime_ns):
+            return False
+        if output_path.suffix.lower() != ".png":
+            return True
+        # A preview-resolution chart is stale for a print-resolution run;
+        # opening the image only reads its header
+        with Image.open(output_path) as image:
+            dpi = image.info.get('dpi')
+        return dpi is not None and round(dpi[0]) == self.dpi
+
+    def _read_csv(self, csv_path: str) -> ChartData:
+        """
+        Read a CSV file, reusing the parsed table while the file is unchanged.
+
+        Callers must treat the returned table as read-only.
+        """
+        path = Path(csv_path).resolve()
+        mtime = path.stat().st_mtime_ns
+        cached = self._csv_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        data = _load_csv(path)
+        self._csv_cache[path] = (mtime, data)
+        return data
+
+    def _get_figure(self, figsize, nrows: int = 1, ncols: int = 1):
+        """
+        Return a cleared (figure, axes) pair of the given shape.
 
-    def generate_adoption_chart(self, csv_path: str, output_name: str = "adoption_chart.png") -> str:
+        Reuses a pooled figure when one exists, which skips rebuilding the
+        figure, axes and their transforms for every chart.
+        """
+        dpi = self.dpi
+        key = (figsize, dpi, nrows, ncols)
+        if key in self._fig_pool:
+            fig, axes = self._fig_pool[key]
+            for ax in fig.axes:
+                ax.cla()
+            # Start tight_layout from the default margins, as on a new figure
+            fig.subplots_adjust(**{name: matplotlib.rcParams[f'figure.subplot.{name}']
+                                   for name in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')})
+            return fig, axes
+
+        # Figures are drawn on their own Agg canvas, outside pyplot's figure
+        # registry, so saving skips pyplot's state lookups
+        fig = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(nrows, ncols)
+        self._fig_pool[key] = (fig, axes)
+        return fig, axes
+
+    def close_all(self):
+        """Release every pooled figure."""
+        self._fig_pool.clear()
+
+    def generate_adoption_chart(self, csv_path: str, output_name: Optional[str] = None,
+                                force: bool = False) -> str:
         """
         Generate adoption metrics chart showing year-over-year growth.
 
         Args:
             csv_path: Path to adoption_metrics.csv
-            output_name: Output filename
+            output_name: Output filename (default: <chart name>.<output_format>)
+            force: Render even if the chart is newer than its data
 
         Returns:
             Path to generated chart
         """
-        df = pd.read_csv(csv_path)
+        output_path = self._output_path(output_name, "adoption_chart")
+        if not force and self._is_up_to_date(csv_path, output_path):
+            print(f"[OK] Up to date: {output_path}")
+            return str(output_path)
+
+        table = self._read_csv(csv_path)
 
-        fig, ax = plt.subplots(figsize=(8, 5), dpi=150)
+        fig, ax = self._get_figure((8, 5))
 
         years = ['2024', '2025', '2026 Projected']
         x = range(len(years))
         width = 0.2
 
-        metrics = df['Metric'].tolist()
+        metrics = table.labels
+        data = table.values()
         for i, metric in enumerate(metrics):
-            values = df.iloc[i, 1:].values.astype(float)
+            values = data[i]
             bars = ax.bar([xi + i * width for xi in x], values, width,
-                         label=metric, color=self.color_list[i % len(self.color_list)])
+                         label=metric, color=self._palette[i % len(self._palette)])
             # Add value labels on bars
-            for bar, val in zip(bars, values):
-                ax.annotate(f'{val:.0f}',
-                           xy=(bar.get_x() + bar.get_width() / 2, bar.get_height()),
-                           ha='center', va='bottom', fontsize=8)
+            ax.bar_label(bars, fmt='{:.0f}', fontsize=8)
 
         ax.set_xlabel('Year', fontsize=11, fontweight='bold')
         ax.set_ylabel('Percentage / Minutes', fontsize=11, fontweight='bold')
@@ -76,101 +272,103 @@ class GraphGenerator:
         ax.legend(loc='upper left', fontsize=9, framealpha=0.9)
         ax.set_ylim(0, 100)
 
-        plt.tight_layout()
-        output_path = self.output_dir / output_name
-        plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close()
+        fig.tight_layout()
+        self._save(fig, output_path)
 
         print(f"[OK] Generated: {output_path}")
         return str(output_path)
 
-    def generate_framework_comparison(self, csv_path: str, output_name: str = "framework_comparison.png") -> str:
+    def generate_framework_comparison(self, csv_path: str, output_name: Optional[str] = None,
+                                      force: bool = False) -> str:
         """
         Generate framework comparison bar chart.
 
         Args:
             csv_path: Path to framework_comparison.csv
-            output_name: Output filename
+            output_name: Output filename (default: <chart name>.<output_format>)
+            force: Render even if the chart is newer than its data
 
         Returns:
             Path to generated chart
         """
-        df = pd.read_csv(csv_path)
+        output_path = self._output_path(output_name, "framework_comparison")
+        if not force and self._is_up_to_date(csv_path, output_path):
+            print(f"[OK] Up to date: {output_path}")
+            return str(output_path)
 
-        fig, axes = plt.subplots(1, 3, figsize=(12, 4), dpi=150)
+        table = self._read_csv(csv_path)
 
-        frameworks = df['Framework'].tolist()
-        colors = [self.color_list[i % len(self.color_list)] for i in range(len(frameworks))]
+        fig, axes = self._get_figure((12, 4), nrows=1, ncols=3)
+
+        frameworks = table.labels
+        colors = [self._palette[i % len(self._palette)] for i in range(len(frameworks))]
 
         # Latency (lower is better)
         ax1 = axes[0]
-        bars1 = ax1.barh(frameworks, df['Latency (ms)'], color=colors)
+        bars1 = ax1.barh(frameworks, table.column('Latency (ms)'), color=colors)
         ax1.set_xlabel('Latency (ms)', fontsize=10, fontweight='bold')
         ax1.set_title('Response Latency', fontsize=11, fontweight='bold')
         ax1.invert_xaxis()  # Lower is better, so invert
-        for bar, val in zip(bars1, df['Latency (ms)']):
-            ax1.annotate(f'{val}ms', xy=(val - 5, bar.get_y() + bar.get_height()/2),
-                        ha='right', va='center', fontsize=8, color='white', fontweight='bold')
+        ax1.bar_label(bars1, fmt='{:g}ms', label_type='center', fontsize=8, color='white', fontweight='bold')
 
         # Token Efficiency
         ax2 = axes[1]
-        bars2 = ax2.barh(frameworks, df['Token Efficiency'], color=colors)
+        bars2 = ax2.barh(frameworks, table.column('Token Efficiency'), color=colors)
         ax2.set_xlabel('Token Efficiency (%)', fontsize=10, fontweight='bold')
         ax2.set_title('Token Efficiency', fontsize=11, fontweight='bold')
         ax2.set_xlim(70, 100)
-        for bar, val in zip(bars2, df['Token Efficiency']):
-            ax2.annotate(f'{val}%', xy=(val - 1, bar.get_y() + bar.get_height()/2),
-                        ha='right', va='center', fontsize=8, color='white', fontweight='bold')
+        ax2.bar_label(bars2, fmt='{:g}%', label_type='center', fontsize=8, color='white', fontweight='bold')
 
         # Success Rate
         ax3 = axes[2]
-        bars3 = ax3.barh(frameworks, df['Success Rate'], color=colors)
+        bars3 = ax3.barh(frameworks, table.column('Success Rate'), color=colors)
         ax3.set_xlabel('Success Rate (%)', fontsize=10, fontweight='bold')
         ax3.set_title('Success Rate', fontsize=11, fontweight='bold')
         ax3.set_xlim(85, 100)
-        for bar, val in zip(bars3, df['Success Rate']):
-            ax3.annotate(f'{val}%', xy=(val - 0.5, bar.get_y() + bar.get_height()/2),
-                        ha='right', va='center', fontsize=8, color='white', fontweight='bold')
+        ax3.bar_label(bars3, fmt='{:g}%', label_type='center', fontsize=8, color='white', fontweight='bold')
 
-        plt.suptitle('Agent Framework Comparison', fontsize=14, fontweight='bold', y=1.02)
-        plt.tight_layout()
+        fig.suptitle('Agent Framework Comparison', fontsize=14, fontweight='bold')
+        fig.tight_layout()
 
-        output_path = self.output_dir / output_name
-        plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close()
+        self._save(fig, output_path)
 
         print(f"[OK] Generated: {output_path}")
         return str(output_path)
 
-    def generate_model_performance_radar(self, csv_path: str, output_name: str = "model_performance.png") -> str:
+    def generate_model_performance_radar(self, csv_path: str, output_name: Optional[str] = None,
+                                         force: bool = False) -> str:
         """
         Generate model performance comparison chart.
 
         Args:
             csv_path: Path to model_performance.csv
-            output_name: Output filename
+            output_name: Output filename (default: <chart name>.<output_format>)
+            force: Render even if the chart is newer than its data
 
         Returns:
             Path to generated chart
         """
-        df = pd.read_csv(csv_path)
+        output_path = self._output_path(output_name, "model_performance")
+        if not force and self._is_up_to_date(csv_path, output_path):
+            print(f"[OK] Up to date: {output_path}")
+            return str(output_path)
+
+        table = self._read_csv(csv_path)
 
-        fig, ax = plt.subplots(figsize=(10, 5), dpi=150)
+        fig, ax = self._get_figure((10, 5))
 
-        models = df['Model'].tolist()
+        models = table.labels
         x = range(len(models))
         width = 0.25
 
         metrics = ['Tool Use Accuracy', 'Multi-Step Planning', 'Code Generation']
 
+        data = table.values(*metrics)
         for i, metric in enumerate(metrics):
-            values = df[metric].values
+            values = data[:, i]
             bars = ax.bar([xi + i * width for xi in x], values, width,
-                         label=metric, color=self.color_list[i])
-            for bar, val in zip(bars, values):
-                ax.annotate(f'{val:.1f}',
-                           xy=(bar.get_x() + bar.get_width() / 2, bar.get_height()),
-                           ha='center', va='bottom', fontsize=7)
+                         label=metric, color=self._palette[i])
+            ax.bar_label(bars, fmt='{:.1f}', fontsize=7)
 
         ax.set_xlabel('Model', fontsize=11, fontweight='bold')
         ax.set_ylabel('Score (%)', fontsize=11, fontweight='bold')
@@ -180,85 +378,122 @@ class GraphGenerator:
         ax.legend(loc='lower right', fontsize=9)
         ax.set_ylim(80, 100)
 
-        plt.tight_layout()
-        output_path = self.output_dir / output_name
-        plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close()
+        fig.tight_layout()
+        self._save(fig, output_path)
 
         print(f"[OK] Generated: {output_path}")
         return str(output_path)
 
-    def generate_cost_comparison(self, csv_path: str, output_name: str = "cost_comparison.png") -> str:
+    def generate_cost_comparison(self, csv_path: str, output_name: Optional[str] = None,
+                                 force: bool = False) -> str:
         """
         Generate cost comparison chart.
 
         Args:
             csv_path: Path to model_performance.csv
-            output_name: Output filename
+            output_name: Output filename (default: <chart name>.<output_format>)
+            force: Render even if the chart is newer than its data
 
         Returns:
             Path to generated chart
         """
-        df = pd.read_csv(csv_path)
+        output_path = self._output_path(output_name, "cost_comparison")
+        if not force and self._is_up_to_date(csv_path, output_path):
+            print(f"[OK] Up to date: {output_path}")
+            return str(output_path)
 
-        fig, ax = plt.subplots(figsize=(8, 5), dpi=150)
+        table = self._read_csv(csv_path)
 
-        models = df['Model'].tolist()
-        costs = df['Cost per 1M Tokens'].values
-        colors = [self.color_list[i % len(self.color_list)] for i in range(len(models))]
+        fig, ax = self._get_figure((8, 5))
+
+        models = table.labels
+        costs = table.column('Cost per 1M Tokens')
+        colors = [self._palette[i % len(self._palette)] for i in range(len(models))]
 
         bars = ax.bar(models, costs, color=colors)
 
         # Add value labels
-        for bar, cost in zip(bars, costs):
-            ax.annotate(f'${cost:.2f}',
-                       xy=(bar.get_x() + bar.get_width() / 2, bar.get_height()),
-                       ha='center', va='bottom', fontsize=10, fontweight='bold')
+        ax.bar_label(bars, fmt='${:.2f}', fontsize=10, fontweight='bold')
 
         ax.set_xlabel('Model', fontsize=11, fontweight='bold')
         ax.set_ylabel('Cost per 1M Tokens ($)', fontsize=11, fontweight='bold')
         ax.set_title('LLM Cost Comparison', fontsize=14, fontweight='bold', pad=15)
-        plt.xticks(rotation=15, ha='right')
+        plt.setp(ax.get_xticklabels(), rotation=15, ha='right')
 
-        plt.tight_layout()
-        output_path = self.output_dir / output_name
-        plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close()
+        fig.tight_layout()
+        self._save(fig, output_path)
 
         print(f"[OK] Generated: {output_path}")
         return str(output_path)
 
-    def generate_all_charts(self, data_dir: str) -> List[str]:
+    def generate_all_charts(self, data_dir: str, force: bool = False) -> List[str]:
         """
         Generate all charts from data directory.
 
+        Charts already newer than their CSV (and this module) are kept, so a
+        run with nothing changed only stats the files.
+
         Args:
             data_dir: Directory containing CSV files
+            force: Re-render every chart regardless of timestamps
 
         Returns:
             List of paths to generated charts
         """
         data_path = Path(data_dir)
-        generated = []
 
         print("Generating magazine charts...")
         print("=" * 50)
 
-        # Adoption metrics
+        # Collect the charts whose data is present
+        jobs = []
+        ext = self.output_format
         adoption_csv = data_path / "adoption_metrics.csv"
         if adoption_csv.exists():
-            generated.append(self.generate_adoption_chart(str(adoption_csv)))
+            jobs.append((self.generate_adoption_chart, adoption_csv, f"adoption_chart.{ext}"))
 
-        # Framework comparison
         framework_csv = data_path / "framework_comparison.csv"
         if framework_csv.exists():
-            generated.append(self.generate_framework_comparison(str(framework_csv)))
+            jobs.append((self.generate_framework_comparison, framework_csv, f"framework_comparison.{ext}"))
 
-        # Model performance
         model_csv = data_path / "model_performance.csv"
         if model_csv.exists():
-            generated.append(self.generate_model_performance_radar(str(model_csv)))
-            generated.append(self.generate_cost_comparison(str(model_csv)))
+            jobs.append((self.generate_model_performance_radar, model_csv, f"model_performance.{ext}"))
+            jobs.append((self.generate_cost_comparison, model_csv, f"cost_comparison.{ext}"))
+
+        # Charts are independent and rendering is CPU-bound, so render them in
+        # separate processes when more than one needs rendering and there is
+        # more than one core to use
+        stale = sum(
+            1 for _, csv_path, output_name in jobs
+            if force or not self._is_up_to_date(csv_path, self.output_dir / output_name)
+        )
+        workers = min(stale, os.cpu_count() or 1)
+        if workers > 1:
+            # Forked workers inherit the imported matplotlib and its loaded
+            # font cache instead of importing them again; fork is only safe
+            # to rely on under Linux, so elsewhere keep the platform default
+            mp_context = multiprocessing.get_context("fork") if sys.platform.startswith("linux") else None
+            with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+                futures = [
+                    executor.submit(generate, str(csv_path), output_name, force=force)
+                    for generate, csv_path, output_name in jobs
+                ]
+                generated = [future.result() for future in futures]
+        else:
+            self._png_writer = ThreadPoolExecutor(max_workers=2)
+            try:
+                generated = [
+                    generate(str(csv_path), output_name, force=force)
+                    for generate, csv_path, output_name in jobs
+                ]
+                for write in self._png_writes:
+                    write.result()
+            finally:
+                self._png_writer.shutdown()
+                self._png_writer = None
+                self._png_writes = []
+                self.close_all()
 
         print("=" * 50)
         print(f"[OK] Generated {len(generated)} charts")
@@ -267,8 +502,15 @@ class GraphGenerator:
 
 
 def main():
-    """Generate charts for magazine."""
-    generator = GraphGenerator()
+    """
+    Generate charts for magazine.
+
+    Charts render at preview resolution (100 DPI) by default; set
+    ``MAG_DPI=300`` for the final print pass. ``MAG_CHART_FORMAT=pdf`` (or
+    ``svg``) writes vector charts instead of PNGs.
+    """
+    generator = GraphGenerator(dpi=int(os.environ.get("MAG_DPI", "100")),
+                               output_format=os.environ.get("MAG_CHART_FORMAT", "png"))
     data_dir = "artifacts/sample_content/magazine/data"
 
     charts = generator.generate_all_charts(data_dir)
@@ -1,7 +1,9 @@
 """LaTeX document generator with comprehensive formatting support."""
 
+import io
+import re
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional, TextIO, Tuple
 
 
 @dataclass
@@ -31,231 +33,222 @@ class DocumentConfig:
     extra_packages: List[str] = field(default_factory=list)
 
 
+@dataclass(slots=True, frozen=True)
+class Section:
+    """One block of document content, in the order it was added."""
+    type: str  # section, table, csv_table, figure, wrapfigure, tikz, list, raw
+    content: str
+    command: str = ""  # sectioning command, for type "section" only
+    title: str = ""
+
+# Inline markdown: **bold**, __bold__, *italic*, _italic_ or `code`. Italic
+# delimiters never sit next to another marker, so a bold span nested in
+# italics is left for the recursive pass.
+_MARKDOWN_INLINE_RE = re.compile(
+    r'\*\*(.+?)\*\*|__(.+?)__'
+    r'|\*(?!\*)(.+?)(?<!\*)\*(?!\*)|_(?!_)(.+?)(?<!_)_(?!_)'
+    r'|`(.+?)`'
+)
+
+
+# Sectioning commands by add_section level
+_SECTION_CMDS = ("chapter", "section", "subsection", "subsubsection")
+
+# Packages every generated document loads, right after \documentclass
+_STATIC_PACKAGES = (
+    "\n\n% Packages\n"
+    "\\usepackage[utf8]{inputenc}\n"
+    "\\usepackage[T1]{fontenc}\n"
+    "\\usepackage{lmodern}\n"
+    "\\usepackage{graphicx}\n"
+    "\\usepackage{hyperref}\n"
+    "\\usepackage{cite}\n"
+    "\\usepackage{amsmath}\n"
+    "\\usepackage{booktabs}\n"
+    "\\usepackage{array}\n"
+    "\\usepackage{float}\n"
+    "\\usepackage{wrapfig}\n"
+    "\\usepackage{caption}\n"
+    "\\usepackage{subcaption}\n"
+    "\\usepackage{geometry}\n"
+    "\\usepackage{fancyhdr}\n"
+    "\\usepackage{csvsimple}\n"
+    "\\usepackage{longtable}\n"
+    "\\usepackage{tikz}\n"
+    "\\usepackage{xcolor}"
+)
+
+# Link styling written after the page layout blocks
+_HYPERREF_SETUP = (
+    "\n\n% Hyperref settings\n"
+    "\\hypersetup{\n"
+    "    colorlinks=true,\n"
+    "    linkcolor=blue,\n"
+    "    filecolor=magenta,\n"
+    "    urlcolor=cyan,\n"
+    "    citecolor=blue,\n"
+    "}"
+)
+
+
 class LaTeXGenerator:
     """Generate LaTeX documents with advanced formatting."""
 
+    __slots__ = ("config", "content_sections", "bibliography_entries", "_shared_sections")
+
     def __init__(self, config: DocumentConfig):
         self.config = config
-        self.content_sections = []
+        self.content_sections: List[Section] = []
         self.bibliography_entries = []
 
+        # Sections are immutable, so repeated CSV tables and figures with the
+        # same arguments reuse one instance instead of formatting it again
+        self._shared_sections: Dict[Tuple[Optional[str], ...], Section] = {}
+
     def generate_preamble(self) -> str:
         """Generate the document preamble with packages and settings."""
-        options = [self.config.font_size, self.config.paper_size]
-        if self.config.two_column:
-            options.append("twocolumn")
-
-        preamble = [
-            f"\\documentclass[{','.join(options)}]{{{self.config.doc_class}}}",
-            "",
-            "% Packages",
-            "\\usepackage[utf8]{inputenc}",
-            "\\usepackage[T1]{fontenc}",
-            "\\usepackage{lmodern}",
-            "\\usepackage{graphicx}",
-            "\\usepackage{hyperref}",
-            "\\usepackage{cite}",
-            "\\usepackage{amsmath}",
-            "\\usepackage{booktabs}",
-            "\\usepackage{array}",
-            "\\usepackage{float}",
-            "\\usepackage{wrapfig}",
-            "\\usepackage{caption}",
-            "\\usepackage{subcaption}",
-            "\\usepackage{geometry}",
-            "\\usepackage{fancyhdr}",
-            "\\usepackage{csvsimple}",
-            "\\usepackage{longtable}",
-            "\\usepackage{tikz}",
-            "\\usepackage{xcolor}",
-        ]
+        buf = io.StringIO()
+        self._write_preamble(buf)
+        return buf.getvalue()
+
+    def _write_preamble(self, out: TextIO) -> None:
+        """Write the document preamble to ``out``."""
+        config = self.config
+        write = out.write
+        options = f"{config.font_size},{config.paper_size}"
+        if config.two_column:
+            options += ",twocolumn"
+        write(f"\\documentclass[{options}]{{{config.doc_class}}}")
+        write(_STATIC_PACKAGES)
 
         # Add extra packages
-        for pkg in self.config.extra_packages:
-            preamble.append(f"\\usepackage{{{pkg}}}")
+        for pkg in config.extra_packages:
+            write(f"\n\\usepackage{{{pkg}}}")
 
         # Geometry settings
-        preamble.extend([
-            "",
-            "% Page geometry",
-            "\\geometry{margin=1in}",
-        ])
+        write("\n\n% Page geometry\n\\geometry{margin=1in}")
 
         # Header/Footer setup
-        if any([self.config.header_left, self.config.header_center, self.config.header_right,
-                self.config.footer_left, self.config.footer_center, self.config.footer_right]):
-            preamble.extend([
-                "",
-                "% Header and Footer",
-                "\\pagestyle{fancy}",
-                "\\fancyhf{}",
-            ])
-
-            if self.config.header_left:
-                preamble.append(f"\\fancyhead[L]{{{self.config.header_left}}}")
-            if self.config.header_center:
-                preamble.append(f"\\fancyhead[C]{{{self.config.header_center}}}")
-            if self.config.header_right:
-                preamble.append(f"\\fancyhead[R]{{{self.config.header_right}}}")
-            if self.config.footer_left:
-                preamble.append(f"\\fancyfoot[L]{{{self.config.footer_left}}}")
-            if self.config.footer_center:
-                preamble.append(f"\\fancyfoot[C]{{{self.config.footer_center}}}")
-            if self.config.footer_right:
-                preamble.append(f"\\fancyfoot[R]{{{self.config.footer_right}}}")
+        if any([config.header_left, config.header_center, config.header_right,
+                config.footer_left, config.footer_center, config.footer_right]):
+            write("\n\n% Header and Footer\n\\pagestyle{fancy}\n\\fancyhf{}")
+
+            if config.header_left:
+                write(f"\n\\fancyhead[L]{{{config.header_left}}}")
+            if config.header_center:
+                write(f"\n\\fancyhead[C]{{{config.header_center}}}")
+            if config.header_right:
+                write(f"\n\\fancyhead[R]{{{config.header_right}}}")
+            if config.footer_left:
+                write(f"\n\\fancyfoot[L]{{{config.footer_left}}}")
+            if config.footer_center:
+                write(f"\n\\fancyfoot[C]{{{config.footer_center}}}")
+            if config.footer_right:
+                write(f"\n\\fancyfoot[R]{{{config.footer_right}}}")
 
         # Hyperref settings
-        preamble.extend([
-            "",
-            "% Hyperref settings",
-            "\\hypersetup{",
-            "    colorlinks=true,",
-            "    linkcolor=blue,",
-            "    filecolor=magenta,",
-            "    urlcolor=cyan,",
-            "    citecolor=blue,",
-            "}",
-        ])
+        write(_HYPERREF_SETUP)
 
         # Title information
-        if self.config.title:
-            preamble.extend([
-                "",
-                f"\\title{{{self.config.title}}}",
-                f"\\author{{{self.config.author}}}",
-                f"\\date{{{self.config.date}}}",
-            ])
-
-        return "\n".join(preamble)
+        if config.title:
+            write(f"\n\n\\title{{{config.title}}}"
+                  f"\n\\author{{{config.author}}}"
+                  f"\n\\date{{{config.date}}}")
 
     def add_section(self, title: str, content: str, level: int = 1):
         """Add a section to the document."""
-        section_cmd = {
-            0: "chapter",
-            1: "section",
-            2: "subsection",
-            3: "subsubsection",
-        }.get(level, "section")
-
-        self.content_sections.append({
-            "type": "section",
-            "command": section_cmd,
-            "title": title,
-            "content": content
-        })
+        section_cmd = _SECTION_CMDS[level] if 0 <= level < len(_SECTION_CMDS) else "section"
+
+        self.content_sections.append(Section("section", content, section_cmd, title))
 
     def add_table(self, caption: str, headers: List[str], rows: List[List[str]],
                   label: Optional[str] = None):
         """Add a formatted table to the document."""
-        col_format = "l" * len(headers)
-
-        table_content = [
-            "\\begin{table}[H]",
-            "\\centering",
-            f"\\begin{{tabular}}{{{col_format}}}",
-            "\\toprule",
-            " & ".join(headers) + " \\\\",
-            "\\midrule",
-        ]
-
-        for row in rows:
-            table_content.append(" & ".join(row) + " \\\\")
-
-        table_content.extend([
-            "\\bottomrule",
-            "\\end{tabular}",
-            f"\\caption{{{caption}}}",
-        ])
-
-        if label:
-            table_content.append(f"\\label{{{label}}}")
-
-        table_content.append("\\end{table}")
-
-        self.content_sections.append({
-            "type": "table",
-            "content": "\n".join(table_content)
-        })
+        body = "".join([" & ".join(row) + " \\\\\n" for row in rows])
+        label_line = f"\\label{{{label}}}\n" if label else ""
+        self.content_sections.append(Section(
+            "table",
+            "\\begin{table}[H]\n"
+            "\\centering\n"
+            f"\\begin{{tabular}}{{{'l' * len(headers)}}}\n"
+            "\\toprule\n"
+            f"{' & '.join(headers)} \\\\\n"
+            "\\midrule\n"
+            f"{body}"
+            "\\bottomrule\n"
+            "\\end{tabular}\n"
+            f"\\caption{{{caption}}}\n"
+            f"{label_line}"
+            "\\end{table}"
+        ))
 
     def add_csv_table(self, caption: str, csv_file: str, label: Optional[str] = None):
         """Add a table from a CSV file."""
-        table_content = [
-            "\\begin{table}[H]",
-            "\\centering",
-            "\\csvautotabular{" + csv_file + "}",
-            f"\\caption{{{caption}}}",
-        ]
-
-        if label:
-            table_content.append(f"\\label{{{label}}}")
-
-        table_content.append("\\end{table}")
-
-        self.content_sections.append({
-            "type": "csv_table",
-            "content": "\n".join(table_content)
-        })
+        key = ("csv_table", caption, csv_file, label)
+        section = self._shared_sections.get(key)
+        if section is None:
+            label_line = f"\\label{{{label}}}\n" if label else ""
+            section = self._shared_sections[key] = Section(
+                "csv_table",
+                "\\begin{table}[H]\n"
+                "\\centering\n"
+                f"\\csvautotabular{{{csv_file}}}\n"
+                f"\\caption{{{caption}}}\n"
+                f"{label_line}"
+                "\\end{table}"
+            )
+        self.content_sections.append(section)
 
     def add_figure(self, image_path: str, caption: str, width: str = "0.8\\textwidth",
                    label: Optional[str] = None):
         """Add a figure to the document."""
-        figure_content = [
-            "\\begin{figure}[H]",
-            "\\centering",
-            f"\\includegraphics[width={width}]{{{image_path}}}",
-            f"\\caption{{{caption}}}",
-        ]
-
-        if label:
-            figure_content.append(f"\\label{{{label}}}")
-
-        figure_content.append("\\end{figure}")
-
-        self.content_sections.append({
-            "type": "figure",
-            "content": "\n".join(figure_content)
-        })
+        key = ("figure", image_path, caption, width, label)
+        section = self._shared_sections.get(key)
+        if section is None:
+            label_line = f"\\label{{{label}}}\n" if label else ""
+            section = self._shared_sections[key] = Section(
+                "figure",
+                "\\begin{figure}[H]\n"
+                "\\centering\n"
+                f"\\includegraphics[width={width}]{{{image_path}}}\n"
+                f"\\caption{{{caption}}}\n"
+                f"{label_line}"
+                "\\end{figure}"
+            )
+        self.content_sections.append(section)
 
     def add_wrapped_figure(self, image_path: str, caption: str, width: str = "0.4\\textwidth",
                           position: str = "r", label: Optional[str] = None):
         """Add a figure with text wrapping."""
-        figure_content = [
-            f"\\begin{{wrapfigure}}{{{position}}}{{{width}}}",
-            "\\centering",
-            f"\\includegraphics[width={width}]{{{image_path}}}",
-            f"\\caption{{{caption}}}",
-        ]
-
-        if label:
-            figure_content.append(f"\\label{{{label}}}")
-
-        figure_content.append("\\end{wrapfigure}")
-
-        self.content_sections.append({
-            "type": "wrapfigure",
-            "content": "\n".join(figure_content)
-        })
+        key = ("wrapfigure", image_path, caption, width, position, label)
+        section = self._shared_sections.get(key)
+        if section is None:
+            label_line = f"\\label{{{label}}}\n" if label else ""
+            section = self._shared_sections[key] = Section(
+                "wrapfigure",
+                f"\\begin{{wrapfigure}}{{{position}}}{{{width}}}\n"
+                "\\centering\n"
+                f"\\includegraphics[width={width}]{{{image_path}}}\n"
+                f"\\caption{{{caption}}}\n"
+                f"{label_line}"
+                "\\end{wrapfigure}"
+            )
+        self.content_sections.append(section)
 
     def add_tikz_diagram(self, tikz_code: str, caption: str, label: Optional[str] = None):
         """Add a TikZ vector diagram."""
-        figure_content = [
-            "\\begin{figure}[H]",
-            "\\centering",
-            "\\begin{tikzpicture}",
-            tikz_code,
-            "\\end{tikzpicture}",
-            f"\\caption{{{caption}}}",
-        ]
-
-        if label:
-            figure_content.append(f"\\label{{{label}}}")
-
-        figure_content.append("\\end{figure}")
-
-        self.content_sections.append({
-            "type": "tikz",
-            "content": "\n".join(figure_content)
-        })
+        label_line = f"\\label{{{label}}}\n" if label else ""
+        self.content_sections.append(Section(
+            "tikz",
+            "\\begin{figure}[H]\n"
+            "\\centering\n"
+            "\\begin{tikzpicture}\n"
+            f"{tikz_code}\n"
+            "\\end{tikzpicture}\n"
+            f"\\caption{{{caption}}}\n"
+            f"{label_line}"
+            "\\end{figure}"
+        ))
 
     def add_citation(self, cite_key: str) -> str:
         """Add an inline citation reference."""
@@ -267,27 +260,13 @@ class LaTeXGenerator:
 
     def add_itemize_list(self, items: List[str]):
         """Add a bulleted list."""
-        list_content = ["\\begin{itemize}"]
-        for item in items:
-            list_content.append(f"  \\item {item}")
-        list_content.append("\\end{itemize}")
-
-        self.content_sections.append({
-            "type": "list",
-            "content": "\n".join(list_content)
-        })
+        body = "".join([f"  \\item {item}\n" for item in items])
+        self.content_sections.append(Section("list", f"\\begin{{itemize}}\n{body}\\end{{itemize}}"))
 
     def add_enumerate_list(self, items: List[str]):
         """Add a numbered list."""
-        list_content = ["\\begin{enumerate}"]
-        for item in items:
-            list_content.append(f"  \\item {item}")
-        list_content.append("\\end{enumerate}")
-
-        self.content_sections.append({
-            "type": "list",
-            "content": "\n".join(list_content)
-        })
+        body = "".join([f"  \\item {item}\n" for item in items])
+        self.content_sections.append(Section("list", f"\\begin{{enumerate}}\n{body}\\end{{enumerate}}"))
 
     def add_hyperlink(self, url: str, text: Optional[str] = None) -> str:
         """Create a hyperlink."""
@@ -298,76 +277,98 @@ class LaTeXGenerator:
 
     def add_raw_latex(self, latex_code: str):
         """Add raw LaTeX code."""
-        self.content_sections.append({
-            "type": "raw",
-            "content": latex_code
-        })
+        self.content_sections.append(Section("raw", latex_code))
+
+    def extend_raw_latex(self, fragments: List[str]):
+        """Add several raw LaTeX fragments in one call, preserving their order."""
+        self.content_sections.extend(Section("raw", fragment) for fragment in fragments)
 
     def generate_document(self) -> str:
         """Generate the complete LaTeX document."""
-        doc = [self.generate_preamble(), "", "\\begin{document}"]
+        buf = io.StringIO()
+        self._write_document(buf)
+        return buf.getvalue()
+
+    def _write_document(self, out: TextIO) -> None:
+        """Write the complete LaTeX document to ``out`` section by section."""
+        write = out.write
+        self._write_preamble(out)
+        write("\n\n\\begin{document}")
 
         # Title page
         if self.config.title:
-            doc.extend(["", "\\maketitle"])
+            write("\n\n\\maketitle")
 
         # Table of contents
         if self.config.include_toc:
-            doc.extend(["", "\\tableofcontents", "\\newpage"])
+            write("\n\n\\tableofcontents\n\\newpage")
 
         # Content sections
         for section in self.content_sections:
-            doc.append("")
-            if section["type"] == "section":
-                doc.append(f"\\{section['command']}{{{section['title']}}}")
-                doc.append(section["content"])
-            else:
-                doc.append(section["content"])
+            write("\n\n")
+            if section.type == "section":
+                write(f"\\{section.command}{{{section.title}}}\n")
+            write(section.content)
 
         # Bibliography
         if self.config.include_bibliography and self.bibliography_entries:
-            doc.extend([
-                "",
-                "\\begin{thebibliography}{99}",
-            ])
+            write("\n\n\\begin{thebibliography}{99}")
             for entry in self.bibliography_entries:
-                doc.append(entry)
-            doc.append("\\end{thebibliography}")
-
-        doc.extend(["", "\\end{document}"])
+                write("\n")
+                write(entry)
+            write("\n\\end{thebibliography}")
 
-        return "\n".join(doc)
+        write("\n\n\\end{document}")
 
     def save(self, output_path: str):
-        """Save the LaTeX document to a file."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(self.generate_document())
+        """Save the LaTeX document to a file.
+
+        Sections are streamed into a large write buffer rather than joined
+        into one string first, so peak memory stays near the largest section.
+        """
+        with open(output_path, 'w', encoding='utf-8', newline='', buffering=1 << 16) as f:
+            self._write_document(f)
         return output_path
 
 
+def _escape_latex(text: str) -> str:
+    """Backslash-escape the LaTeX special characters ``& % $ # _ { }``.
+
+    Chained ``str.replace`` calls each run as a C-level search and measure
+    far faster than ``str.translate``, whose multi-character mapping is
+    looked up one character at a time.
+    """
+    return (text.replace("&", "\\&").replace("%", "\\%").replace("$", "\\$").replace("#", "\\#")
+            .replace("_", "\\_").replace("{", "\\{").replace("}", "\\}"))
+
+
+def _convert_inline_markdown(text: str) -> str:
+    """Convert inline markdown spans to LaTeX commands and escape the text around them."""
+    # split() yields the leading text, then for each span its five groups
+    # followed by the text up to the next span
+    parts = _MARKDOWN_INLINE_RE.split(text)
+    out = [_escape_latex(parts[0])]
+    for i in range(1, len(parts), 6):
+        bold, bold_alt, italic, italic_alt, code, following = parts[i:i + 6]
+        if bold is not None or bold_alt is not None:
+            out.append(f"\\textbf{{{_convert_inline_markdown(bold or bold_alt)}}}")
+        elif italic is not None or italic_alt is not None:
+            out.append(f"\\textit{{{_convert_inline_markdown(italic or italic_alt)}}}")
+        else:
+            out.append(f"\\texttt{{{_escape_latex(code)}}}")
+        out.append(_escape_latex(following))
+    return "".join(out)
+
+
 def markdown_to_latex(markdown_text: str) -> str:
-    """Convert basic markdown to LaTeX."""
-    latex = markdown_text
-
-    # Bold
-    import re
-    latex = re.sub(r'\*\*(.+?)\*\*', r'\\textbf{\1}', latex)
-    latex = re.sub(r'__(.+?)__', r'\\textbf{\1}', latex)
-
-    # Italic
-    latex = re.sub(r'\*(.+?)\*', r'\\textit{\1}', latex)
-    latex = re.sub(r'_(.+?)_', r'\\textit{\1}', latex)
-
-    # Code
-    latex = re.sub(r'`(.+?)`', r'\\texttt{\1}', latex)
-
-    # Special characters
-    latex = latex.replace('&', '\\&')
-    latex = latex.replace('%', '\\%')
-    latex = latex.replace('$', '\\$')
-    latex = latex.replace('#', '\\#')
-    latex = latex.replace('_', '\\_')
-    latex = latex.replace('{', '\\{')
-    latex = latex.replace('}', '\\}')
-
-    return latex
+    """Convert basic markdown to LaTeX.
+
+    Bold, italic and code spans are split out in one regex pass and the text
+    between them is escaped separately, so the braces of the generated
+    commands are never escaped themselves. Text inside bold and italic spans
+    is converted recursively; code spans only have their special characters
+    escaped.
+    """
+    if not any(c in markdown_text for c in "*_`"):
+        return _escape_latex(markdown_text)
+    return _convert_inline_markdown(markdown_text)
@@ -1,5 +1,7 @@
 """LLM-Based LaTeX Generator that uses Claude for intelligent document generation."""
 
+import asyncio
+import hashlib
 import json
 import os
 from dataclasses import dataclass
@@ -7,6 +9,94 @@ from typing import Dict, List, Optional, Tuple
 
 import anthropic
 
+# Model used for every generation and repair call
+_MODEL = "claude-sonnet-4-20250514"
+
+# Sampling settings for initial generation (room for documents with many
+# figures, low temperature for consistent LaTeX) and for validation fixes
+_GENERATION_MAX_TOKENS = 16000
+_GENERATION_TEMPERATURE = 0.2
+_VALIDATION_MAX_TOKENS = 8000
+_VALIDATION_TEMPERATURE = 0.1
+
+# Seconds a streamed response may go without data before it is abandoned
+_STREAM_IDLE_TIMEOUT = 30.0
+
+# Print streaming progress about every 1000 tokens (~4 characters each)
+_STREAM_REPORT_CHARS = 4000
+
+def _stream_params(content, max_tokens: int, temperature: float) -> Dict:
+    """Keyword arguments for a single-turn ``messages.stream`` call."""
+    return {
+        "model": _MODEL,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "messages": [{"role": "user", "content": content}],
+        "timeout": _STREAM_IDLE_TIMEOUT,
+    }
+
+
+def _content_key(latex_content: str) -> str:
+    """Content hash identifying a LaTeX document for the validation cache."""
+    return hashlib.blake2b(latex_content.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _validation_prompt(latex_content: str) -> str:
+    """Build the validation prompt for a generated document."""
+    return f"""You are a LaTeX syntax validator and fixer. Analyze this LaTeX document and fix any issues.
+
+**LaTeX Document to Validate:**
+```latex
+{latex_content}
+```
+
+**Validation Checklist:**
+1. Proper document structure (\\documentclass, \\begin{{document}}, \\end{{document}})
+2. All special characters properly escaped
+3. All environments properly closed
+4. Package usage is correct and packages exist
+5. No syntax errors
+6. Proper use of math mode
+7. Figure and table references are valid
+8. No orphaned braces or brackets
+
+**Your Task:**
+1. Identify any syntax errors or issues
+2. Fix all issues while preserving the document's intent
+3. List what improvements you made
+
+**Output Format:**
+First, list any issues you found as JSON:
+{{"issues": ["issue1", "issue2"]}}
+
+Then provide the CORRECTED LaTeX code (complete document).
+"""
+
+
+class _StreamProgress:
+    """Collect streamed text and print progress about every 1000 tokens."""
+
+    __slots__ = ("chunks", "received", "next_report")
+
+    def __init__(self):
+        self.chunks = []
+        self.received = 0
+        self.next_report = _STREAM_REPORT_CHARS
+
+    def add(self, text: str):
+        """Record one streamed chunk."""
+        self.chunks.append(text)
+        self.received += len(text)
+        if self.received >= self.next_report:
+            print(f"   ... {self.received:,} characters received")
+            self.next_report += _STREAM_REPORT_CHARS
+
+    def finish(self, stop_reason: Optional[str], max_tokens: int) -> str:
+        """Return the full text, warning if the response was cut off at ``max_tokens``."""
+        if stop_reason == "max_tokens":
+            print(f"⚠️ Response hit the {max_tokens}-token limit and is likely truncated")
+        return "".join(self.chunks)
+
 
 @dataclass
 class LaTeXGenerationRequest:
@@ -37,6 +127,35 @@ class LaTeXGenerationResult:
     error_message: Optional[str] = None
 
 
+def _generation_result(latex_content: str,
+                       validation: Optional[Tuple[str, List[str], List[str]]]) -> LaTeXGenerationResult:
+    """Successful result for generated LaTeX and its optional validation outcome."""
+    warnings = []
+    improvements_made = []
+    if validation is not None:
+        latex_content, validation_warnings, fixes = validation
+        warnings.extend(validation_warnings)
+        improvements_made.extend(fixes)
+
+    return LaTeXGenerationResult(
+        success=True,
+        latex_content=latex_content,
+        warnings=warnings,
+        improvements_made=improvements_made
+    )
+
+
+def _failed_generation() -> LaTeXGenerationResult:
+    """Result returned when the initial LaTeX could not be generated."""
+    return LaTeXGenerationResult(
+        success=False,
+        latex_content="",
+        warnings=[],
+        improvements_made=[],
+        error_message="Failed to generate initial LaTeX"
+    )
+
+
 class LLMLaTeXGenerator:
     """
     LLM-based LaTeX generator that uses Claude to intelligently create
@@ -52,77 +171,170 @@ class LLMLaTeXGenerator:
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not found")
         self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.async_client = anthropic.AsyncAnthropic(api_key=self.api_key)
+
+        # Validation results keyed by a hash of the LaTeX they validated, so a
+        # byte-identical regenerated document skips the second LLM round trip
+        self._validation_cache: Dict[str, Tuple[str, List[str], List[str]]] = {}
+
+    def _stream_message(self, content, max_tokens: int, temperature: float) -> Tuple[str, Optional[str]]:
+        """
+        Stream a single-turn completion and return its text and stop reason.
+
+        Streaming keeps the connection active for long generations and lets
+        a stalled response fail after ``_STREAM_IDLE_TIMEOUT`` seconds without
+        data (the HTTP read timeout applies between chunks) rather than
+        hanging until the request-level default expires.
+
+        Args:
+            content: User message content (a string or content blocks)
+            max_tokens: Output token limit
+            temperature: Sampling temperature
+
+        Returns:
+            Tuple of (concatenated response text, stop reason)
+        """
+        progress = _StreamProgress()
+        with self.client.messages.stream(**_stream_params(content, max_tokens, temperature)) as stream:
+            for text in stream.text_stream:
+                progress.add(text)
+            message = stream.get_final_message()
+        return progress.finish(message.stop_reason, max_tokens), message.stop_reason
+
+    async def _stream_message_async(self, content, max_tokens: int,
+                                    temperature: float) -> Tuple[str, Optional[str]]:
+        """Async counterpart of :meth:`_stream_message` using the async client."""
+        progress = _StreamProgress()
+        async with self.async_client.messages.stream(**_stream_params(content, max_tokens, temperature)) as stream:
+            async for text in stream.text_stream:
+                progress.add(text)
+            message = await stream.get_final_message()
+        return progress.finish(message.stop_reason, max_tokens), message.stop_reason
+
+    def _stream_text(self, content, max_tokens: int, temperature: float) -> str:
+        """Stream a single-turn completion and return only its text."""
+        return self._stream_message(content, max_tokens, temperature)[0]
 
     def generate_document(self, request: LaTeXGenerationRequest,
-                          validate: bool = True) -> LaTeXGenerationResult:
+                          validate: bool = True, use_cache: bool = True) -> LaTeXGenerationResult:
         """
         Generate a complete LaTeX document using LLM reasoning.
 
         Args:
             request: LaTeX generation request with content and requirements
             validate: Whether to validate and fix LaTeX syntax
+            use_cache: Reuse the validation result of identical LaTeX
 
         Returns:
             LaTeXGenerationResult with generated LaTeX and metadata
         """
-        print("📝 Generating LaTeX document with LLM reasoning...")
+        print(f"📝 Generating LaTeX document '{request.title}' with LLM reasoning...")
 
         # Step 1: Generate initial LaTeX
         latex_content = self._generate_initial_latex(request)
 
         if not latex_content:
-            return LaTeXGenerationResult(
-                success=False,
-                latex_content="",
-                warnings=[],
-                improvements_made=[],
-                error_message="Failed to generate initial LaTeX"
-            )
+            return _failed_generation()
 
         # Step 2: Validate and fix syntax if requested
-        warnings = []
-        improvements_made = []
+        validation = None
+        if validate:
+            print("🔍 Validating and improving LaTeX syntax...")
+            validation = self._validate_and_fix_latex(latex_content, request, use_cache=use_cache)
 
+        return _generation_result(latex_content, validation)
+
+    async def generate_document_async(self, request: LaTeXGenerationRequest,
+                                      validate: bool = True, use_cache: bool = True) -> LaTeXGenerationResult:
+        """
+        Generate a complete LaTeX document without blocking the event loop.
+
+        Same steps and result as :meth:`generate_document`; validation still
+        waits for the generated LaTeX it checks.
+
+        Args:
+            request: LaTeX generation request with content and requirements
+            validate: Whether to validate and fix LaTeX syntax
+            use_cache: Reuse the validation result of identical LaTeX
+
+        Returns:
+            LaTeXGenerationResult with generated LaTeX and metadata
+        """
+        print(f"📝 Generating LaTeX document '{request.title}' with LLM reasoning...")
+
+        latex_content = await self._generate_initial_latex_async(request)
+
+        if not latex_content:
+            return _failed_generation()
+
+        validation = None
         if validate:
             print("🔍 Validating and improving LaTeX syntax...")
-            latex_content, validation_warnings, fixes = self._validate_and_fix_latex(
-                latex_content, request
-            )
-            warnings.extend(validation_warnings)
-            improvements_made.extend(fixes)
+            validation = await self._validate_and_fix_latex_async(latex_content, request, use_cache=use_cache)
+
+        return _generation_result(latex_content, validation)
+
+    async def generate_batch(self, requests: List[LaTeXGenerationRequest], validate: bool = True,
+                             max_concurrency: int = 4, use_cache: bool = True) -> List[LaTeXGenerationResult]:
+        """
+        Generate several independent documents concurrently.
 
-        return LaTeXGenerationResult(
-            success=True,
-            latex_content=latex_content,
-            warnings=warnings,
-            improvements_made=improvements_made
-        )
+        Each document still runs generation then validation in order, but the
+        documents overlap, so a batch takes roughly as long as its slowest
+        member rather than the sum of all of them.
+
+        Args:
+            requests: Generation requests, one per document
+            validate: Whether to validate and fix each document's LaTeX
+            max_concurrency: Most documents in flight at once, to stay within
+                the account's request rate limit
+            use_cache: Reuse the validation result of identical LaTeX
+
+        Returns:
+            Results in the same order as ``requests``
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate(request: LaTeXGenerationRequest) -> LaTeXGenerationResult:
+            async with semaphore:
+                return await self.generate_document_async(request, validate=validate, use_cache=use_cache)
+
+        return list(await asyncio.gather(*(generate(request) for request in requests)))
 
     def _generate_initial_latex(self, request: LaTeXGenerationRequest) -> str:
         """Generate initial LaTeX document using Claude."""
-        # Build the generation prompt
-        prompt = self._build_generation_prompt(request)
-
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=16000,  # Increased for complex documents with many figures
-                temperature=0.2,  # Lower temperature for more consistent LaTeX
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
+            response_text = self._stream_text(
+                self._build_generation_prompt(request),
+                max_tokens=_GENERATION_MAX_TOKENS,
+                temperature=_GENERATION_TEMPERATURE,
             )
+            return self._generated_latex(response_text)
 
-            # Extract LaTeX from response
-            latex_content = self._extract_latex_from_response(response.content[0].text)
-            print(f"✅ Generated {len(latex_content)} characters of LaTeX")
-            return latex_content
+        except Exception as e:
+            print(f"❌ Error generating LaTeX: {e}")
+            return ""
+
+    async def _generate_initial_latex_async(self, request: LaTeXGenerationRequest) -> str:
+        """Async counterpart of :meth:`_generate_initial_latex`."""
+        try:
+            response_text, _ = await self._stream_message_async(
+                self._build_generation_prompt(request),
+                max_tokens=_GENERATION_MAX_TOKENS,
+                temperature=_GENERATION_TEMPERATURE,
+            )
+            return self._generated_latex(response_text)
 
         except Exception as e:
             print(f"❌ Error generating LaTeX: {e}")
             return ""
 
+    def _generated_latex(self, response_text: str) -> str:
+        """Extract and report the LaTeX from a generation response."""
+        latex_content = self._extract_latex_from_response(response_text)
+        print(f"✅ Generated {len(latex_content)} characters of LaTeX")
+        return latex_content
+
     def _build_generation_prompt(self, request: LaTeXGenerationRequest) -> str:
         """Build the prompt for LaTeX generation."""
         # Prepare content sections summary
@@ -263,83 +475,123 @@ Return ONLY the complete LaTeX code, no explanations or markdown code blocks.
         else:
             return response_text.strip()
 
-    def _validate_and_fix_latex(self, latex_content: str,
-                                request: LaTeXGenerationRequest) -> Tuple[str, List[str], List[str]]:
+    def _validate_and_fix_latex(self, latex_content: str, request: LaTeXGenerationRequest,
+                                use_cache: bool = True) -> Tuple[str, List[str], List[str]]:
         """
         Validate LaTeX syntax and fix common issues using LLM reasoning.
 
+        Args:
+            latex_content: Generated LaTeX document
+            request: The request it was generated from
+            use_cache: Return the stored result when this exact LaTeX was
+                validated before, instead of asking the LLM again
+
         Returns:
             Tuple of (fixed_latex, warnings, improvements_made)
         """
-        validation_prompt = f"""You are a LaTeX syntax validator and fixer. Analyze this LaTeX document and fix any issues.
+        key = _content_key(latex_content)
+        if use_cache:
+            cached = self._cached_validation(key)
+            if cached is not None:
+                return cached
 
-**LaTeX Document to Validate:**
-```latex
-{latex_content}
-```
-
-**Validation Checklist:**
-1. Proper document structure (\\documentclass, \\begin{{document}}, \\end{{document}})
-2. All special characters properly escaped
-3. All environments properly closed
-4. Package usage is correct and packages exist
-5. No syntax errors
-6. Proper use of math mode
-7. Figure and table references are valid
-8. No orphaned braces or brackets
-
-**Your Task:**
-1. Identify any syntax errors or issues
-2. Fix all issues while preserving the document's intent
-3. List what improvements you made
+        try:
+            response_text, stop_reason = self._stream_message(
+                _validation_prompt(latex_content),
+                max_tokens=_VALIDATION_MAX_TOKENS,
+                temperature=_VALIDATION_TEMPERATURE,
+            )
+        except Exception as e:
+            print(f"⚠️ Validation error: {e}, using original LaTeX")
+            return latex_content, [f"Validation failed: {str(e)}"], []
 
-**Output Format:**
-First, list any issues you found as JSON:
-{{"issues": ["issue1", "issue2"]}}
+        return self._validation_result(key, latex_content, response_text, stop_reason)
 
-Then provide the CORRECTED LaTeX code (complete document).
-"""
+    async def _validate_and_fix_latex_async(self, latex_content: str, request: LaTeXGenerationRequest,
+                                            use_cache: bool = True) -> Tuple[str, List[str], List[str]]:
+        """Async counterpart of :meth:`_validate_and_fix_latex`."""
+        key = _content_key(latex_content)
+        if use_cache:
+            cached = self._cached_validation(key)
+            if cached is not None:
+                return cached
 
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=8000,
-                temperature=0.1,  # Very low temperature for precise fixes
-                messages=[{
-                    "role": "user",
-                    "content": validation_prompt
-                }]
+            response_text, stop_reason = await self._stream_message_async(
+                _validation_prompt(latex_content),
+                max_tokens=_VALIDATION_MAX_TOKENS,
+                temperature=_VALIDATION_TEMPERATURE,
             )
+        except Exception as e:
+            print(f"⚠️ Validation error: {e}, using original LaTeX")
+            return latex_content, [f"Validation failed: {str(e)}"], []
 
-            response_text = response.content[0].text
+        return self._validation_result(key, latex_content, response_text, stop_reason)
 
-            # Extract issues
-            warnings = []
-            if '"issues":' in response_text:
-                try:
-                    start = response_text.find('{')
-                    end = response_text.find('}', start) + 1
-                    issues_json = json.loads(response_text[start:end])
-                    warnings = issues_json.get('issues', [])
-                except (json.JSONDecodeError, ValueError):
-                    warnings = ["Unable to parse validation issues"]
+    def _validation_result(self, key: str, latex_content: str, response_text: str,
+                           stop_reason: Optional[str]) -> Tuple[str, List[str], List[str]]:
+        """
+        Turn a validation response into (fixed_latex, warnings, improvements_made).
 
-            # Extract fixed LaTeX
-            fixed_latex = self._extract_latex_from_response(response_text)
+        Falls back to ``latex_content`` when the response has no usable
+        document. Only complete responses with a usable document are cached;
+        a truncated one may still be used this time, but the next run should
+        ask again.
+        """
+        fixed_latex, warnings, improvements = self._parse_validation_response(response_text, latex_content)
+
+        # If extraction failed, return original
+        if fixed_latex is None:
+            print("⚠️ Validation fix failed, using original LaTeX")
+            return latex_content, warnings, []
+
+        if stop_reason != "max_tokens":
+            self._store_validation(key, (fixed_latex, warnings, improvements))
+        return fixed_latex, warnings, improvements
+
+    def _cached_validation(self, key: str) -> Optional[Tuple[str, List[str], List[str]]]:
+        """Return a copy of the stored validation result for ``key``, if any."""
+        cached = self._validation_cache.get(key)
+        if cached is None:
+            return None
+        print("ℹ️ Returning cached validation result")
+        fixed_latex, warnings, improvements = cached
+        return fixed_latex, list(warnings), list(improvements)
+
+    def _store_validation(self, key: str, result: Tuple[str, List[str], List[str]]):
+        """Remember a validation result for ``key``."""
+        fixed_latex, warnings, improvements = result
+        self._validation_cache[key] = (fixed_latex, list(warnings), list(improvements))
+
+    def _parse_validation_response(self, response_text: str,
+                                   latex_content: str) -> Tuple[Optional[str], List[str], List[str]]:
+        """
+        Split a validation response into the fixed LaTeX, issues and improvements.
 
-            # If extraction failed, return original
-            if not fixed_latex or len(fixed_latex) < len(latex_content) * 0.5:
-                print("⚠️ Validation fix failed, using original LaTeX")
-                return latex_content, warnings, []
+        The fixed LaTeX is None when the response has no usable document (none
+        at all, or less than half the length of ``latex_content``).
+        """
+        # Extract issues
+        warnings = []
+        if '"issues":' in response_text:
+            try:
+                start = response_text.find('{')
+                end = response_text.find('}', start) + 1
+                issues_json = json.loads(response_text[start:end])
+                warnings = issues_json.get('issues', [])
+            except (json.JSONDecodeError, ValueError):
+                warnings = ["Unable to parse validation issues"]
 
-            improvements = [f"Fixed {len(warnings)} LaTeX issues"] if warnings else []
-            print(f"✅ Validated and fixed {len(warnings)} issues")
+        # Extract fixed LaTeX
+        fixed_latex = self._extract_latex_from_response(response_text)
 
-            return fixed_latex, warnings, improvements
+        if not fixed_latex or len(fixed_latex) < len(latex_content) * 0.5:
+            return None, warnings, []
 
-        except Exception as e:
-            print(f"⚠️ Validation error: {e}, using original LaTeX")
-            return latex_content, [f"Validation failed: {str(e)}"], []
+        improvements = [f"Fixed {len(warnings)} LaTeX issues"] if warnings else []
+        print(f"✅ Validated and fixed {len(warnings)} issues")
+
+        return fixed_latex, warnings, improvements
 
     def apply_visual_qa_fixes(self, latex_content: str,
                              issues: List[str]) -> Tuple[str, bool, List[str]]:
@@ -405,18 +657,12 @@ Generate a small block of LaTeX commands that should be INSERTED just before \\b
 """
 
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
+            response_text = self._stream_text(
+                fix_prompt,
                 max_tokens=1000,  # Small output - just patches
                 temperature=0.1,
-                messages=[{
-                    "role": "user",
-                    "content": fix_prompt
-                }]
             )
 
-            response_text = response.content[0].text
-
             # Extract LaTeX commands from response
             if '```latex' in response_text:
                 start = response_text.find('```latex') + 8
@@ -529,17 +775,13 @@ Generate ONLY the remaining content needed to properly end this document.
 Return ONLY the LaTeX completion code, no explanations."""
 
             try:
-                response = self.client.messages.create(
-                    model="claude-sonnet-4-20250514",
+                response_text = self._stream_text(
+                    completion_prompt,
                     max_tokens=4000,  # Enough for completion, not full document
                     temperature=0.1,
-                    messages=[{
-                        "role": "user",
-                        "content": completion_prompt
-                    }]
                 )
 
-                completion = response.content[0].text.strip()
+                completion = response_text.strip()
 
                 # Clean up the completion - remove markdown code blocks if present
                 if '```latex' in completion:
@@ -640,17 +882,13 @@ Return ONLY the COMPLETE CORRECTED LaTeX document, no explanations.
 """
 
             try:
-                response = self.client.messages.create(
-                    model="claude-sonnet-4-20250514",
+                response_text = self._stream_text(
+                    correction_prompt,
                     max_tokens=8000,
                     temperature=0.1,
-                    messages=[{
-                        "role": "user",
-                        "content": correction_prompt
-                    }]
                 )
 
-                corrected_latex = self._extract_latex_from_response(response.content[0].text)
+                corrected_latex = self._extract_latex_from_response(response_text)
 
                 # Validate correction
                 if not corrected_latex or len(corrected_latex) < len(latex_content) * 0.5:
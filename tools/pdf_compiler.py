@@ -1,10 +1,14 @@
 """PDF compiler for LaTeX documents with intelligent error correction."""
 
+import asyncio
 import re
 import subprocess
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+# Seconds a single pdflatex run may take before it is killed
+_COMPILE_TIMEOUT = 60
+
 
 class PDFCompiler:
     """Compile LaTeX documents to PDF using pdflatex."""
@@ -71,12 +75,7 @@ class PDFCompiler:
         if not tex_path.exists():
             return False, f"LaTeX file not found: {tex_file}"
 
-        # Determine output directory
-        if self.output_dir:
-            output_path = Path(self.output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
-        else:
-            output_path = tex_path.parent
+        output_path = self._resolve_output_path(tex_path)
 
         # Try compilation with error correction
         for attempt in range(max_fix_attempts + 1):
@@ -98,7 +97,57 @@ class PDFCompiler:
                     return False, f"Could not automatically fix LaTeX errors:\n{message}"
 
             except subprocess.TimeoutExpired:
-                return False, "Compilation timed out (60s limit exceeded)"
+                return False, f"Compilation timed out ({_COMPILE_TIMEOUT}s limit exceeded)"
+            except FileNotFoundError:
+                return False, "pdflatex not found. Please install TeX Live or MiKTeX."
+            except Exception as e:
+                return False, f"Compilation error: {str(e)}"
+
+        return False, "Maximum fix attempts exceeded"
+
+    async def compile_async(self, tex_file: str, runs: int = 2, max_fix_attempts: int = 3) -> Tuple[bool, str]:
+        """
+        Compile a LaTeX file to PDF without blocking the event loop.
+
+        Same behaviour as :meth:`compile`, but pdflatex runs as an asyncio
+        subprocess so callers can overlap compilation with other work.
+
+        Args:
+            tex_file: Path to the .tex file
+            runs: Number of compilation runs (default 2 for proper references)
+            max_fix_attempts: Maximum number of error correction attempts
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        tex_path = Path(tex_file)
+
+        if not tex_path.exists():
+            return False, f"LaTeX file not found: {tex_file}"
+
+        output_path = self._resolve_output_path(tex_path)
+
+        # Try compilation with error correction
+        for attempt in range(max_fix_attempts + 1):
+            try:
+                success, message = await self._attempt_compilation_async(tex_path, output_path, runs)
+
+                if success:
+                    return True, message
+
+                # If this was the last attempt, return failure
+                if attempt == max_fix_attempts:
+                    return False, f"Compilation failed after {max_fix_attempts} fix attempts:\n{message}"
+
+                # Try to fix the error and continue
+                print(f"Compilation attempt {attempt + 1} failed. Attempting to fix errors...")
+                fixed = self._auto_fix_latex_errors(tex_path, message)
+
+                if not fixed:
+                    return False, f"Could not automatically fix LaTeX errors:\n{message}"
+
+            except asyncio.TimeoutError:
+                return False, f"Compilation timed out ({_COMPILE_TIMEOUT}s limit exceeded)"
             except FileNotFoundError:
                 return False, "pdflatex not found. Please install TeX Live or MiKTeX."
             except Exception as e:
@@ -106,6 +155,14 @@ class PDFCompiler:
 
         return False, "Maximum fix attempts exceeded"
 
+    def _resolve_output_path(self, tex_path: Path) -> Path:
+        """Return the output directory for a compilation, creating it if configured."""
+        if self.output_dir:
+            output_path = Path(self.output_dir)
+            output_path.mkdir(parents=True, exist_ok=True)
+            return output_path
+        return tex_path.parent
+
     def _attempt_compilation(self, tex_path: Path, output_path: Path, runs: int) -> Tuple[bool, str]:
         """Attempt to compile the LaTeX document."""
         for run in range(runs):
@@ -118,12 +175,42 @@ class PDFCompiler:
                 ],
                 capture_output=True,
                 text=True,
-                timeout=60
+                timeout=_COMPILE_TIMEOUT
             )
 
             if result.returncode != 0:
                 return False, f"Compilation failed on run {run + 1}:\n{result.stdout}\n{result.stderr}"
 
+        return self._check_pdf_created(tex_path, output_path)
+
+    async def _attempt_compilation_async(self, tex_path: Path, output_path: Path, runs: int) -> Tuple[bool, str]:
+        """Attempt to compile the LaTeX document using asyncio subprocesses."""
+        for run in range(runs):
+            proc = await asyncio.create_subprocess_exec(
+                'pdflatex',
+                '-interaction=nonstopmode',
+                '-output-directory', str(output_path),
+                str(tex_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=_COMPILE_TIMEOUT)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+
+            if proc.returncode != 0:
+                return False, (
+                    f"Compilation failed on run {run + 1}:\n"
+                    f"{stdout.decode('utf-8', errors='replace')}\n{stderr.decode('utf-8', errors='replace')}"
+                )
+
+        return self._check_pdf_created(tex_path, output_path)
+
+    def _check_pdf_created(self, tex_path: Path, output_path: Path) -> Tuple[bool, str]:
+        """Check for the compiled PDF and clean up auxiliary files on success."""
         pdf_file = output_path / f"{tex_path.stem}.pdf"
 
         if pdf_file.exists():
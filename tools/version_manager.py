@@ -11,6 +11,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class VersionManager:
     """
@@ -57,12 +62,21 @@ class VersionManager:
 
     def _load_manifest(self) -> Dict:
         """Load the version manifest."""
+        if orjson is not None:
+            return orjson.loads(self.manifest_path.read_bytes())
         with open(self.manifest_path, 'r', encoding='utf-8') as f:
             return json.load(f)
 
     def _save_manifest(self, manifest: Dict):
-        """Save the version manifest."""
+        """Save the version manifest.
+
+        Uses orjson when installed, writing its UTF-8 bytes directly; the
+        stdlib json fallback produces the same layout.
+        """
         manifest["last_updated"] = datetime.now().isoformat()
+        if orjson is not None:
+            self.manifest_path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+            return
         with open(self.manifest_path, 'w', encoding='utf-8') as f:
             json.dump(manifest, f, indent=2, ensure_ascii=False)
 